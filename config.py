@@ -1,43 +1,198 @@
 # config.py
+import functools
+import importlib.util
 import os
+from typing import Any, Dict, Optional
 
-from dotenv import load_dotenv
+from utils import json_utils
 
-# .env ファイルの読み込み
-load_dotenv()
+
+@functools.lru_cache(maxsize=1)
+def _load_env_file() -> None:
+    """.env ファイルを読み込む（プロセス内で一度だけ実行）"""
+    # 必須の環境変数が既に設定済みなら .env の読み込み自体を省略する
+    if os.environ.get("OPENAI_API_KEY"):
+        return
+
+    # scripts/compile_env.py で生成したキャッシュが最新ならそれを使用する
+    env = _load_compiled_env()
+    if env is not None:
+        for key, value in env.items():
+            os.environ.setdefault(key, value)
+        return
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+def _load_compiled_env() -> Optional[Dict[str, str]]:
+    """
+    生成済みの _env_cache モジュールから環境変数を取得
+
+    Returns:
+        Optional[Dict[str, str]]: 環境変数の辞書（キャッシュが無いか古い場合は None）
+    """
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+
+    # .env が削除された場合は、削除前の値（認証情報など）を使い続けないようにする
+    try:
+        env_mtime_ns = os.stat(os.path.join(base_dir, ".env")).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    # sys.path や作業ディレクトリではなく、このファイルと同じディレクトリのものを読み込む
+    cache_file = os.path.join(base_dir, "_env_cache.py")
+    spec = importlib.util.spec_from_file_location("_env_cache", cache_file)
+    if spec is None or not os.path.exists(cache_file):
+        return None
+    env_cache = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(env_cache)
+    except (OSError, SyntaxError):
+        return None
+
+    if env_mtime_ns != env_cache.ENV_MTIME_NS:
+        return None
+    return env_cache.ENV
+
+
+# 設定として読み込む環境変数とそのデフォルト値
+_ENV_KEYS = (
+    "DB_PATH",
+    "OPENAI_API_KEY",
+    "NOTE_EMAIL",
+    "NOTE_PASSWORD",
+    "LOG_LEVEL",
+    "SEARCH_SERVICE_TYPE",
+    "SEARCH_ENGINE",
+)
+_DEFAULTS: Dict[str, Optional[str]] = {
+    "DB_PATH": "news_reports.db",
+    "LOG_LEVEL": "INFO",
+    "SEARCH_SERVICE_TYPE": "web",  # "web" または "openai"
+    "SEARCH_ENGINE": "google",  # "google" または "duckduckgo"
+}
+
+
+def _read_env() -> Dict[str, Optional[str]]:
+    """環境変数を一度だけ読み込んで辞書にする"""
+    _load_env_file()
+    return {key: os.environ.get(key, _DEFAULTS.get(key)) for key in _ENV_KEYS}
+
+
+# 環境変数のキャッシュ（モジュール読み込み時に一度だけ作成）
+_ENV_CACHE = _read_env()
+
+# 設定ファイルの解析結果キャッシュ（パスと更新時刻が一致する間は再解析しない）
+_SETTINGS_CACHE: Dict[str, Any] = {"path": None, "mtime": 0, "data": {}}
 
 
 class Config:
     """アプリケーション設定"""
 
     # データベース設定
-    DB_PATH = os.getenv("DB_PATH", "news_reports.db")
+    DB_PATH: str = _ENV_CACHE["DB_PATH"]
 
     # OpenAI API設定
-    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+    OPENAI_API_KEY: Optional[str] = _ENV_CACHE["OPENAI_API_KEY"]
 
     # Note設定
-    NOTE_EMAIL = os.getenv("NOTE_EMAIL")
-    NOTE_PASSWORD = os.getenv("NOTE_PASSWORD")
+    NOTE_EMAIL: Optional[str] = _ENV_CACHE["NOTE_EMAIL"]
+    NOTE_PASSWORD: Optional[str] = _ENV_CACHE["NOTE_PASSWORD"]
+    # Noteの認証情報（メールアドレスとパスワード）が揃っているか（update で更新）
+    has_note_credentials: bool = bool(
+        _ENV_CACHE["NOTE_EMAIL"] and _ENV_CACHE["NOTE_PASSWORD"]
+    )
 
     # 検索サービス設定
-    SEARCH_SERVICE_TYPE = os.getenv(
-        "SEARCH_SERVICE_TYPE", "web"
-    )  # "web" または "openai"
-    SEARCH_ENGINE = os.getenv("SEARCH_ENGINE", "google")  # "google" または "duckduckgo"
+    SEARCH_SERVICE_TYPE: str = _ENV_CACHE["SEARCH_SERVICE_TYPE"]
+    SEARCH_ENGINE: str = _ENV_CACHE["SEARCH_ENGINE"]
 
     # アプリケーション設定
-    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    LOG_LEVEL: str = _ENV_CACHE["LOG_LEVEL"]
+
+    # GUIから保存される設定ファイル
+    SETTINGS_FILE: str = "app_settings.json"
 
     @classmethod
-    def validate(cls):
-        """設定の検証"""
-        required_env_vars = ["OPENAI_API_KEY"]
+    def load_from_file(cls) -> Dict[str, Any]:
+        """
+        設定ファイルを読み込む
+
+        Returns:
+            Dict[str, Any]: 保存されている設定（ファイルが無い場合は空の辞書）
+        """
+        try:
+            st = os.stat(cls.SETTINGS_FILE)
+        except FileNotFoundError:
+            return {}
+
+        if (
+            _SETTINGS_CACHE["path"] == cls.SETTINGS_FILE
+            and _SETTINGS_CACHE["mtime"] == st.st_mtime_ns
+        ):
+            return dict(_SETTINGS_CACHE["data"])
+
+        with open(cls.SETTINGS_FILE, "rb") as f:
+            data = json_utils.loads(f.read())
+
+        _SETTINGS_CACHE.update(path=cls.SETTINGS_FILE, mtime=st.st_mtime_ns, data=data)
+        return dict(data)
+
+    @classmethod
+    def save_to_file(cls, settings: Dict[str, Any]) -> None:
+        """
+        設定ファイルに保存する
+
+        Args:
+            settings: 保存する設定
+        """
+        # 書き込み途中のファイルを読まれないよう、一時ファイルに書いてから置き換える
+        tmp_path = f"{cls.SETTINGS_FILE}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(json_utils.dumps(settings, indent=True))
+        os.replace(tmp_path, cls.SETTINGS_FILE)
 
-        missing_vars = [var for var in required_env_vars if not getattr(cls, var)]
+        # 書き込んだ内容をそのままキャッシュしておく
+        _SETTINGS_CACHE.update(
+            path=cls.SETTINGS_FILE,
+            mtime=os.stat(cls.SETTINGS_FILE).st_mtime_ns,
+            data=dict(settings),
+        )
 
-        if missing_vars:
-            raise ValueError(f"環境変数が設定されていません: {', '.join(missing_vars)}")
+    @classmethod
+    def update(cls, mirror_env: bool = True, **values: Any) -> None:
+        """
+        設定値を更新
+
+        Args:
+            mirror_env: 環境変数にも反映するかどうか
+            **values: 更新する設定値（キーは _ENV_KEYS のいずれか）
+        """
+        for key, value in values.items():
+            if key not in _ENV_CACHE:
+                raise KeyError(f"未知の設定キーです: {key}")
+            _ENV_CACHE[key] = value
+            setattr(cls, key, value)
+            if mirror_env:
+                os.environ[key] = "" if value is None else str(value)
+        cls.has_note_credentials = bool(cls.NOTE_EMAIL and cls.NOTE_PASSWORD)
+
+    @classmethod
+    def reset_cache(cls) -> None:
+        """環境変数を読み直してキャッシュと設定値を再構築（テスト用）"""
+        _ENV_CACHE.clear()
+        _ENV_CACHE.update(_read_env())
+        for key, value in _ENV_CACHE.items():
+            setattr(cls, key, value)
+        cls.has_note_credentials = bool(cls.NOTE_EMAIL and cls.NOTE_PASSWORD)
+
+    @classmethod
+    def validate(cls):
+        """設定の検証"""
+        if not cls.OPENAI_API_KEY:
+            raise ValueError("環境変数が設定されていません: OPENAI_API_KEY")
 
         if cls.NOTE_EMAIL and not cls.NOTE_PASSWORD:
             raise ValueError(
@@ -10,31 +10,49 @@
 
 
 # main.py
+import asyncio
+import atexit
+import functools
 import logging
+import logging.handlers
 import os
+import queue
 
 from config import Config
-from repositories.article_repository import ArticleRepository
-from repositories.news_repository import NewsRepository
-from repositories.topic_repository import TopicRepository
-from services.app_service import AppService
-from services.article_service import ArticleService
-from services.note_poster_service import NotePosterService
-from ui.app_ui import AppUI
-from utils.db_utils import DatabaseManager
 
 
 def setup_logging():
-    """ログ設定"""
+    """
+    ログ設定
+
+    ハンドラではキューに積むだけにし、コンソール・ファイルへの書き出しは
+    QueueListener のスレッドで行う（ログを出力する処理がI/Oで止まらないようにする）。
+    """
+    # ファイル出力はバッファリングし、ERROR以上のときだけ即時に書き出す
+    # （整形は QueueHandler 側で行われるため、書き出し側のハンドラはそのまま出力する）
+    file_handler = logging.FileHandler("app.log")
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=256, flushLevel=logging.ERROR, target=file_handler
+    )
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, logging.StreamHandler(), buffered_handler
+    )
+    listener.start()
+    # 終了時はキューに残ったログを書き出してからハンドラを閉じる
+    atexit.register(listener.stop)
+
     logging.basicConfig(
         level=getattr(logging, Config.LOG_LEVEL),
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[logging.StreamHandler(), logging.FileHandler("app.log")],
+        handlers=[logging.handlers.QueueHandler(log_queue)],
     )
 
 
+@functools.lru_cache(maxsize=1)
 def init_services():
-    """サービスの初期化"""
+    """サービスの初期化（同一プロセス内では初回の結果を再利用）"""
     # 設定の検証
     try:
         Config.validate()
@@ -46,6 +64,16 @@ def init_services():
     if Config.SEARCH_ENGINE:
         os.environ["SEARCH_ENGINE"] = Config.SEARCH_ENGINE
 
+    # 重い依存（openai, playwright など）は設定検証が通ってから読み込む
+    from repositories.article_repository import ArticleRepository
+    from repositories.news_repository import NewsRepository
+    from repositories.topic_repository import TopicRepository
+    from services.app_service import AppService
+    from services.article_service import ArticleService
+    from services.note_poster_service import NotePosterService
+    from services.search_service import SearchServiceFactory
+    from utils.db_utils import DatabaseManager
+
     # データベース接続
     db_manager = DatabaseManager(Config.DB_PATH)
 
@@ -55,8 +83,6 @@ def init_services():
     article_repo = ArticleRepository(db_manager)
 
     # サービス
-    from services.search_service import SearchServiceFactory
-
     search_service = SearchServiceFactory.create_service(
         service_type=Config.SEARCH_SERVICE_TYPE, api_key=Config.OPENAI_API_KEY
     )
@@ -64,7 +90,7 @@ def init_services():
 
     # Note投稿サービス（認証情報がある場合のみ）
     note_poster_service = None
-    if Config.NOTE_EMAIL and Config.NOTE_PASSWORD:
+    if Config.has_note_credentials:
         note_poster_service = NotePosterService(Config.NOTE_EMAIL, Config.NOTE_PASSWORD)
 
     # アプリケーションサービス
@@ -90,9 +116,15 @@ def main():
     # サービス初期化
     app_service = init_services()
 
-    # UIの初期化と起動
+    # UIの初期化と起動（gradio の読み込みはここまで遅らせる）
+    from ui.app_ui import AppUI
+
     app_ui = AppUI(app_service)
-    app_ui.launch()
+    try:
+        app_ui.launch()
+    finally:
+        # 検索サービスが共有しているブラウザ・HTTPクライアントを終了
+        asyncio.run(app_service.search_service.close())
 
 
 if __name__ == "__main__":
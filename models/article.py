@@ -1,10 +1,10 @@
 # models/article.py
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Article:
     """記事モデル"""
 
@@ -14,7 +14,7 @@ class Article:
     title: str = ""
     content: str = ""
     improved_content: Optional[str] = None
-    status: str = "draft"  # draft, improved, published
-    created_at: datetime = datetime.now()
-    updated_at: datetime = datetime.now()
+    status: str = "draft"  # streaming, draft, improved, published
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
     published_at: Optional[datetime] = None
@@ -1,10 +1,10 @@
 # models/news_data.py
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsSource:
     """ニュースソースモデル"""
 
@@ -14,14 +14,14 @@ class NewsSource:
     published_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsData:
     """ニュースデータモデル"""
 
     id: Optional[int] = None
     topic_id: Optional[int] = None
     sources: List[NewsSource] = None
-    created_at: datetime = datetime.now()
+    created_at: datetime = field(default_factory=datetime.now)
 
     def __post_init__(self):
         if self.sources is None:
@@ -0,0 +1,16 @@
+# models/topic_bundle.py
+from dataclasses import dataclass
+from typing import Optional
+
+from models.article import Article
+from models.news_data import NewsData
+from models.topic import Topic
+
+
+@dataclass(slots=True)
+class TopicBundle:
+    """トピックと、それに紐づく最新のニュースデータ・記事をまとめたモデル"""
+
+    topic: Topic
+    news_data: Optional[NewsData] = None
+    article: Optional[Article] = None
@@ -0,0 +1,15 @@
+# models/topic_details.py
+from dataclasses import dataclass, field
+from typing import List
+
+from models.article import Article
+from models.topic import Topic
+
+
+@dataclass(slots=True)
+class TopicDetails:
+    """トピックと、ニュースデータの有無・関連する記事の一覧をまとめたモデル"""
+
+    topic: Topic
+    has_news: bool = False
+    articles: List[Article] = field(default_factory=list)
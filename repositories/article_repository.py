@@ -1,4 +1,6 @@
 # repositories/article_repository.py
+import sqlite3
+import time
 from datetime import datetime
 from typing import List, Optional
 
@@ -6,9 +8,41 @@ from models.article import Article
 from utils.db_utils import DatabaseManager
 
 
+# 行変換で多用するため、属性参照を省けるようローカル名に束縛しておく
+_fromts = datetime.fromtimestamp
+
+
 class ArticleRepository:
     """記事のデータベース操作を行うリポジトリクラス"""
 
+    _SELECT_COLS = "id, topic_id, news_data_id, title, content, improved_content, status, created_at, updated_at, published_at"
+    _TABLE = "articles"
+    _INSERT_COLS = "topic_id, news_data_id, title, content, improved_content, status, created_at, updated_at, published_at"
+    _SQL_INSERT = (
+        f"INSERT INTO articles ({_INSERT_COLS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+    _SQL_GET_BY_ID = f"SELECT {_SELECT_COLS} FROM articles WHERE id = ?"
+    _SQL_GET_BY_TOPIC = f"SELECT {_SELECT_COLS} FROM articles WHERE topic_id = ? AND status != 'streaming' ORDER BY created_at DESC, id DESC LIMIT ?"
+    _SQL_UPDATE = "UPDATE articles SET title = ?, content = ?, improved_content = ?, status = ?, updated_at = ?, published_at = ? WHERE id = ?"
+    _SQL_DELETE = "DELETE FROM articles WHERE id = ?"
+    # 生成中（status = 'streaming'）の記事は本文が未完成のため、最新の記事として扱わない
+    _SQL_LATEST_ID_BY_TOPIC = "SELECT id FROM articles WHERE topic_id = ? AND status != 'streaming' ORDER BY created_at DESC, id DESC LIMIT 1"
+    _SQL_IS_IMPROVED = "SELECT improved_content IS NOT NULL FROM articles WHERE id = ?"
+    _SQL_SEARCH = (
+        "SELECT "
+        + ", ".join(f"a.{col}" for col in _SELECT_COLS.split(", "))
+        + " FROM articles_fts f JOIN articles a ON a.id = f.rowid"
+        " WHERE articles_fts MATCH ? ORDER BY f.rank LIMIT ?"
+    )
+    _SQL_LATEST_BY_TOPIC_TEXT = (
+        "SELECT "
+        + ", ".join(f"a.{col}" for col in _SELECT_COLS.split(", "))
+        + " FROM articles a JOIN topics t ON t.id = a.topic_id"
+        " WHERE t.title = ? AND COALESCE(t.description, '') = ? AND a.created_at >= ?"
+        " AND a.status != 'streaming'"
+        " ORDER BY a.created_at DESC, a.id DESC LIMIT 1"
+    )
+
     def __init__(self, db_manager: DatabaseManager):
         """
         リポジトリの初期化
@@ -18,23 +52,53 @@ class ArticleRepository:
         """
         self.db_manager = db_manager
 
-    def create(self, article: Article) -> Article:
+    @staticmethod
+    def _row_to_article(row: tuple) -> Article:
+        """
+        _SELECT_COLS の順に並んだ行を記事に変換
+
+        Args:
+            row: 取得した行
+
+        Returns:
+            Article: 記事
+        """
+        return Article(
+            id=row[0],
+            topic_id=row[1],
+            news_data_id=row[2],
+            title=row[3],
+            content=row[4],
+            improved_content=row[5],
+            status=row[6],
+            created_at=_fromts(row[7]),
+            updated_at=_fromts(row[8]),
+            published_at=_fromts(row[9]) if row[9] else None,
+        )
+
+    def create(
+        self, article: Article, cursor: Optional[sqlite3.Cursor] = None
+    ) -> Article:
         """
         記事を作成
 
         Args:
             article: 作成する記事
+            cursor: DatabaseManager.transaction() のカーソル（指定時はコミットしない）
 
         Returns:
             Article: 作成された記事（IDが設定される）
         """
-        conn = self.db_manager.get_connection()
-        cursor = conn.cursor()
+        if cursor is None:
+            # 書き込みロックを取得したトランザクション内で実行してコミットする
+            with self.db_manager.transaction() as cursor:
+                return self.create(article, cursor)
 
-        now = datetime.now().isoformat()
+        now = int(time.time())
+        now_dt = _fromts(now)
 
         cursor.execute(
-            "INSERT INTO articles (topic_id, news_data_id, title, content, improved_content, status, created_at, updated_at, published_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            self._SQL_INSERT,
             (
                 article.topic_id,
                 article.news_data_id,
@@ -44,17 +108,55 @@ class ArticleRepository:
                 article.status,
                 now,
                 now,
-                article.published_at.isoformat() if article.published_at else None,
+                int(article.published_at.timestamp()) if article.published_at else None,
             ),
         )
 
-        conn.commit()
         article.id = cursor.lastrowid
-        article.created_at = datetime.fromisoformat(now)
-        article.updated_at = datetime.fromisoformat(now)
+        article.created_at = now_dt
+        article.updated_at = now_dt
 
         return article
 
+    def create_many(self, articles: List[Article]) -> List[Article]:
+        """
+        複数の記事を1つのトランザクションでまとめて作成
+
+        Args:
+            articles: 作成する記事のリスト
+
+        Returns:
+            List[Article]: 作成された記事（IDが設定される）
+        """
+        if not articles:
+            return []
+
+        now = int(time.time())
+        now_dt = _fromts(now)
+        rows = [
+            (
+                article.topic_id,
+                article.news_data_id,
+                article.title,
+                article.content,
+                article.improved_content,
+                article.status,
+                now,
+                now,
+                int(article.published_at.timestamp()) if article.published_at else None,
+            )
+            for article in articles
+        ]
+
+        ids = self.db_manager.insert_many(self._TABLE, self._INSERT_COLS, rows)
+
+        for article, article_id in zip(articles, ids):
+            article.id = article_id
+            article.created_at = now_dt
+            article.updated_at = now_dt
+
+        return articles
+
     def get_by_id(self, article_id: int) -> Optional[Article]:
         """
         IDによる記事の取得
@@ -65,99 +167,183 @@ class ArticleRepository:
         Returns:
             Optional[Article]: 見つかった記事、または None
         """
-        conn = self.db_manager.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT * FROM articles WHERE id = ?", (article_id,))
-        row = cursor.fetchone()
+        conn = self.db_manager.get_readonly_connection()
+        row = conn.execute(self._SQL_GET_BY_ID, (article_id,)).fetchone()
 
         if row is None:
             return None
 
-        return Article(
-            id=row["id"],
-            topic_id=row["topic_id"],
-            news_data_id=row["news_data_id"],
-            title=row["title"],
-            content=row["content"],
-            improved_content=row["improved_content"],
-            status=row["status"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            updated_at=datetime.fromisoformat(row["updated_at"]),
-            published_at=datetime.fromisoformat(row["published_at"])
-            if row["published_at"]
-            else None,
-        )
+        return self._row_to_article(row)
 
-    def get_by_topic_id(self, topic_id: int) -> List[Article]:
+    def get_by_topic_id(
+        self, topic_id: int, limit: Optional[int] = None
+    ) -> List[Article]:
         """
-        トピックIDによる記事の取得
+        トピックIDによる記事の取得（新しい順、生成中の記事は含めない）
 
         Args:
             topic_id: 取得する記事のトピックID
+            limit: 取得する最大件数（Noneの場合はすべて）
 
         Returns:
             List[Article]: 見つかった記事のリスト
         """
-        conn = self.db_manager.get_connection()
-        cursor = conn.cursor()
+        conn = self.db_manager.get_readonly_connection()
 
-        cursor.execute(
-            "SELECT * FROM articles WHERE topic_id = ? ORDER BY created_at DESC",
-            (topic_id,),
-        )
-        rows = cursor.fetchall()
-
-        return [
-            Article(
-                id=row["id"],
-                topic_id=row["topic_id"],
-                news_data_id=row["news_data_id"],
-                title=row["title"],
-                content=row["content"],
-                improved_content=row["improved_content"],
-                status=row["status"],
-                created_at=datetime.fromisoformat(row["created_at"]),
-                updated_at=datetime.fromisoformat(row["updated_at"]),
-                published_at=datetime.fromisoformat(row["published_at"])
-                if row["published_at"]
-                else None,
-            )
-            for row in rows
-        ]
+        # LIMIT に負の値を渡すと件数の上限なしになる
+        rows = conn.execute(
+            self._SQL_GET_BY_TOPIC, (topic_id, -1 if limit is None else limit)
+        ).fetchall()
 
-    def update(self, article: Article) -> Article:
+        return [self._row_to_article(row) for row in rows]
+
+    def update(
+        self, article: Article, cursor: Optional[sqlite3.Cursor] = None
+    ) -> Article:
         """
         記事の更新
 
         Args:
             article: 更新する記事
+            cursor: DatabaseManager.transaction() のカーソル（指定時はコミットしない）
 
         Returns:
             Article: 更新された記事
         """
-        conn = self.db_manager.get_connection()
-        cursor = conn.cursor()
+        if cursor is None:
+            # 書き込みロックを取得したトランザクション内で実行してコミットする
+            with self.db_manager.transaction() as cursor:
+                return self.update(article, cursor)
 
-        now = datetime.now().isoformat()
-        article.updated_at = datetime.fromisoformat(now)
+        now = int(time.time())
+        now_dt = _fromts(now)
+        article.updated_at = now_dt
 
         cursor.execute(
-            "UPDATE articles SET title = ?, content = ?, improved_content = ?, status = ?, updated_at = ?, published_at = ? WHERE id = ?",
+            self._SQL_UPDATE,
             (
                 article.title,
                 article.content,
                 article.improved_content,
                 article.status,
                 now,
-                article.published_at.isoformat() if article.published_at else None,
+                int(article.published_at.timestamp()) if article.published_at else None,
                 article.id,
             ),
         )
 
-        conn.commit()
         return article
 
+    def update_many(self, articles: List[Article]) -> List[Article]:
+        """
+        複数の記事を1つのトランザクションでまとめて更新
+
+        Args:
+            articles: 更新する記事のリスト
+
+        Returns:
+            List[Article]: 更新された記事
+        """
+        if not articles:
+            return []
+
+        now = int(time.time())
+        now_dt = _fromts(now)
+        rows = [
+            (
+                article.title,
+                article.content,
+                article.improved_content,
+                article.status,
+                now,
+                int(article.published_at.timestamp()) if article.published_at else None,
+                article.id,
+            )
+            for article in articles
+        ]
+
+        with self.db_manager.transaction() as cursor:
+            cursor.executemany(self._SQL_UPDATE, rows)
+
+        for article in articles:
+            article.updated_at = now_dt
+
+        return articles
+
+    def get_latest_id_by_topic_id(self, topic_id: int) -> Optional[int]:
+        """
+        トピックの最新の記事IDを取得（生成中の記事は除く）
+
+        インデックスで新しい順に辿り、status を確認するため先頭から行を読み込む
+        （通常は最新の1行、生成中の記事がある場合のみその分だけ多く読み込む）。
+
+        Args:
+            topic_id: 記事のトピックID
+
+        Returns:
+            Optional[int]: 最新の記事ID、または None
+        """
+        conn = self.db_manager.get_readonly_connection()
+        row = conn.execute(self._SQL_LATEST_ID_BY_TOPIC, (topic_id,)).fetchone()
+        return row[0] if row else None
+
+    def get_latest_by_topic_text(
+        self, title: str, description: Optional[str], since: datetime
+    ) -> Optional[Article]:
+        """
+        タイトルと説明が一致するトピックの記事のうち、指定日時以降に作成された最新のものを取得
+
+        Args:
+            title: トピックのタイトル
+            description: トピックの説明（None と空文字は同じものとして扱う）
+            since: この日時以降に作成された記事のみを対象にする
+
+        Returns:
+            Optional[Article]: 見つかった記事、または None
+        """
+        conn = self.db_manager.get_readonly_connection()
+        row = conn.execute(
+            self._SQL_LATEST_BY_TOPIC_TEXT,
+            (title, description or "", int(since.timestamp())),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        return self._row_to_article(row)
+
+    def search(self, query: str, limit: int = 20) -> List[Article]:
+        """
+        タイトル・本文・改善後の本文に語句を含む記事を全文検索インデックスで検索（関連度順）
+
+        Args:
+            query: 検索する語句（そのままの並びで一致させる、3文字以上）
+            limit: 取得する最大件数
+
+        Returns:
+            List[Article]: 見つかった記事のリスト
+        """
+        # FTS5 の検索構文として解釈されないよう、語句全体をフレーズとして渡す
+        phrase = '"' + query.replace('"', '""') + '"'
+        conn = self.db_manager.get_readonly_connection()
+        rows = conn.execute(self._SQL_SEARCH, (phrase, limit)).fetchall()
+
+        return [self._row_to_article(row) for row in rows]
+
+    def is_improved(self, article_id: int) -> Optional[bool]:
+        """
+        記事が改善済みかを確認（記事本文は読み込まない）
+
+        Args:
+            article_id: 確認する記事のID
+
+        Returns:
+            Optional[bool]: 改善済みかどうか、記事が存在しない場合は None
+        """
+        conn = self.db_manager.get_readonly_connection()
+        row = conn.execute(self._SQL_IS_IMPROVED, (article_id,)).fetchone()
+        return bool(row[0]) if row else None
+
     def delete(self, article_id: int) -> bool:
         """
         記事の削除
@@ -168,10 +354,7 @@ class ArticleRepository:
         Returns:
             bool: 削除が成功したかどうか
         """
-        conn = self.db_manager.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("DELETE FROM articles WHERE id = ?", (article_id,))
-        conn.commit()
+        with self.db_manager.transaction() as cursor:
+            cursor.execute(self._SQL_DELETE, (article_id,))
 
         return cursor.rowcount > 0
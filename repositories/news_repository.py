@@ -1,15 +1,68 @@
 # repositories/news_repository.py
 import json
+import sqlite3
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from models.news_data import NewsData, NewsSource
+from utils import json_utils
 from utils.db_utils import DatabaseManager
 
 
+# 行変換で多用するため、属性参照を省けるようローカル名に束縛しておく
+_fromiso = datetime.fromisoformat
+_fromts = datetime.fromtimestamp
+
+
+def _decode_source(obj: Dict[str, Any]) -> Any:
+    """
+    JSONデコード時に情報源の辞書を直接 NewsSource に変換する object_hook
+
+    Args:
+        obj: デコードされたJSONオブジェクト
+
+    Returns:
+        Any: 情報源の場合は NewsSource、それ以外は元の辞書
+    """
+    if "url" not in obj:
+        return obj
+
+    published_at = obj.get("published_at")
+    return NewsSource(
+        url=obj["url"],
+        title=obj["title"],
+        content=obj["content"],
+        published_at=_fromiso(published_at) if published_at else None,
+    )
+
+
+def _encode_sources(sources: List[NewsSource]) -> str:
+    """
+    情報源のリストをDB保存用のJSON文字列に変換
+
+    Args:
+        sources: 情報源のリスト
+
+    Returns:
+        str: JSON文字列
+    """
+    # NewsSource はモデルのまま変換できる（published_at はISO形式の文字列になる）
+    return json_utils.dumps(sources).decode("utf-8")
+
+
 class NewsRepository:
     """ニュースデータのデータベース操作を行うリポジトリクラス"""
 
+    _SELECT_COLS = "id, topic_id, sources, created_at"
+    _TABLE = "news_data"
+    _INSERT_COLS = "topic_id, sources, created_at"
+    _SQL_INSERT = f"INSERT INTO news_data ({_INSERT_COLS}) VALUES (?, ?, ?)"
+    _SQL_GET_BY_ID = f"SELECT {_SELECT_COLS} FROM news_data WHERE id = ?"
+    _SQL_GET_BY_TOPIC = f"SELECT {_SELECT_COLS} FROM news_data WHERE topic_id = ? ORDER BY created_at DESC, id DESC LIMIT 1"
+    _SQL_DELETE = "DELETE FROM news_data WHERE id = ?"
+    _SQL_EXISTS_BY_TOPIC = "SELECT EXISTS(SELECT 1 FROM news_data WHERE topic_id = ?)"
+
     def __init__(self, db_manager: DatabaseManager):
         """
         リポジトリの初期化
@@ -19,46 +72,81 @@ class NewsRepository:
         """
         self.db_manager = db_manager
 
-    def create(self, news_data: NewsData) -> NewsData:
+    @staticmethod
+    def _row_to_news_data(row: tuple) -> NewsData:
+        """
+        _SELECT_COLS の順に並んだ行をニュースデータに変換
+
+        Args:
+            row: 取得した行
+
+        Returns:
+            NewsData: ニュースデータ
+        """
+        return NewsData(
+            id=row[0],
+            topic_id=row[1],
+            sources=json.loads(row[2], object_hook=_decode_source),
+            created_at=_fromts(row[3]),
+        )
+
+    def create(
+        self, news_data: NewsData, cursor: Optional[sqlite3.Cursor] = None
+    ) -> NewsData:
         """
         ニュースデータを作成
 
         Args:
             news_data: 作成するニュースデータ
+            cursor: DatabaseManager.transaction() のカーソル（指定時はコミットしない）
 
         Returns:
             NewsData: 作成されたニュースデータ（IDが設定される）
         """
-        conn = self.db_manager.get_connection()
-        cursor = conn.cursor()
-
-        now = datetime.now().isoformat()
-        sources_json = json.dumps(
-            [
-                {
-                    "url": source.url,
-                    "title": source.title,
-                    "content": source.content,
-                    "published_at": source.published_at.isoformat()
-                    if source.published_at
-                    else None,
-                }
-                for source in news_data.sources
-            ],
-            ensure_ascii=False,
-        )
+        if cursor is None:
+            # 書き込みロックを取得したトランザクション内で実行してコミットする
+            with self.db_manager.transaction() as cursor:
+                return self.create(news_data, cursor)
 
-        cursor.execute(
-            "INSERT INTO news_data (topic_id, sources, created_at) VALUES (?, ?, ?)",
-            (news_data.topic_id, sources_json, now),
-        )
+        now = int(time.time())
+        now_dt = _fromts(now)
+        sources_json = _encode_sources(news_data.sources)
+
+        cursor.execute(self._SQL_INSERT, (news_data.topic_id, sources_json, now))
 
-        conn.commit()
         news_data.id = cursor.lastrowid
-        news_data.created_at = datetime.fromisoformat(now)
+        news_data.created_at = now_dt
 
         return news_data
 
+    def create_many(self, items: List[NewsData]) -> List[NewsData]:
+        """
+        複数のニュースデータを1つのトランザクションでまとめて作成
+
+        Args:
+            items: 作成するニュースデータのリスト
+
+        Returns:
+            List[NewsData]: 作成されたニュースデータ（IDが設定される）
+        """
+        if not items:
+            return []
+
+        now = int(time.time())
+        now_dt = _fromts(now)
+        rows = [
+            (news_data.topic_id, _encode_sources(news_data.sources), now)
+            for news_data in items
+        ]
+
+        ids = self.db_manager.insert_many(self._TABLE, self._INSERT_COLS, rows)
+
+        for news_data, news_id in zip(items, ids):
+            news_data.id = news_id
+            news_data.created_at = now_dt
+
+        return items
+
     def get_by_id(self, news_id: int) -> Optional[NewsData]:
         """
         IDによるニュースデータの取得
@@ -69,34 +157,13 @@ class NewsRepository:
         Returns:
             Optional[NewsData]: 見つかったニュースデータ、または None
         """
-        conn = self.db_manager.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT * FROM news_data WHERE id = ?", (news_id,))
-        row = cursor.fetchone()
+        conn = self.db_manager.get_readonly_connection()
+        row = conn.execute(self._SQL_GET_BY_ID, (news_id,)).fetchone()
 
         if row is None:
             return None
 
-        sources_data = json.loads(row["sources"])
-        sources = [
-            NewsSource(
-                url=src["url"],
-                title=src["title"],
-                content=src["content"],
-                published_at=datetime.fromisoformat(src["published_at"])
-                if src["published_at"]
-                else None,
-            )
-            for src in sources_data
-        ]
-
-        return NewsData(
-            id=row["id"],
-            topic_id=row["topic_id"],
-            sources=sources,
-            created_at=datetime.fromisoformat(row["created_at"]),
-        )
+        return self._row_to_news_data(row)
 
     def get_by_topic_id(self, topic_id: int) -> Optional[NewsData]:
         """
@@ -108,37 +175,26 @@ class NewsRepository:
         Returns:
             Optional[NewsData]: 見つかったニュースデータ、または None
         """
-        conn = self.db_manager.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            "SELECT * FROM news_data WHERE topic_id = ? ORDER BY created_at DESC",
-            (topic_id,),
-        )
-        row = cursor.fetchone()
+        conn = self.db_manager.get_readonly_connection()
+        row = conn.execute(self._SQL_GET_BY_TOPIC, (topic_id,)).fetchone()
 
         if row is None:
             return None
 
-        sources_data = json.loads(row["sources"])
-        sources = [
-            NewsSource(
-                url=src["url"],
-                title=src["title"],
-                content=src["content"],
-                published_at=datetime.fromisoformat(src["published_at"])
-                if src["published_at"]
-                else None,
-            )
-            for src in sources_data
-        ]
+        return self._row_to_news_data(row)
 
-        return NewsData(
-            id=row["id"],
-            topic_id=row["topic_id"],
-            sources=sources,
-            created_at=datetime.fromisoformat(row["created_at"]),
-        )
+    def exists_by_topic_id(self, topic_id: int) -> bool:
+        """
+        トピックのニュースデータが存在するかを確認（行の内容は読み込まない）
+
+        Args:
+            topic_id: 確認するトピックのID
+
+        Returns:
+            bool: 存在するかどうか
+        """
+        conn = self.db_manager.get_readonly_connection()
+        return bool(conn.execute(self._SQL_EXISTS_BY_TOPIC, (topic_id,)).fetchone()[0])
 
     def delete(self, news_id: int) -> bool:
         """
@@ -148,12 +204,13 @@ class NewsRepository:
             news_id: 削除するニュースデータのID
 
         Returns:
-            bool: 削除が成功したかどうか
+            bool: 削除が成功したかどうか（記事から参照されている場合は削除せず False）
         """
-        conn = self.db_manager.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("DELETE FROM news_data WHERE id = ?", (news_id,))
-        conn.commit()
+        try:
+            with self.db_manager.transaction() as cursor:
+                cursor.execute(self._SQL_DELETE, (news_id,))
+        except sqlite3.IntegrityError:
+            # 外部キー制約（foreign_keys = ON）により参照されている行は削除できない
+            return False
 
         return cursor.rowcount > 0
@@ -1,14 +1,74 @@
 # repositories/topic_repository.py
+import sqlite3
+import time
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from models.topic import Topic
+from models.topic_bundle import TopicBundle
+from models.topic_details import TopicDetails
+from repositories.article_repository import ArticleRepository
+from repositories.news_repository import NewsRepository
 from utils.db_utils import DatabaseManager
 
 
+# 行変換で多用するため、属性参照を省けるようローカル名に束縛しておく
+_fromts = datetime.fromtimestamp
+
+
 class TopicRepository:
     """トピックのデータベース操作を行うリポジトリクラス"""
 
+    _SELECT_COLS = "id, title, description, created_at, updated_at"
+    _TABLE = "topics"
+    _INSERT_COLS = "title, description, created_at, updated_at"
+    _SQL_INSERT = f"INSERT INTO topics ({_INSERT_COLS}) VALUES (?, ?, ?, ?)"
+    _SQL_GET_BY_ID = f"SELECT {_SELECT_COLS} FROM topics WHERE id = ?"
+    _SQL_GET_ALL = (
+        f"SELECT {_SELECT_COLS} FROM topics ORDER BY created_at DESC, id DESC"
+    )
+    _SQL_UPDATE = (
+        "UPDATE topics SET title = ?, description = ?, updated_at = ? WHERE id = ?"
+    )
+    _SQL_GET_CHOICES = "SELECT id, title FROM topics ORDER BY id DESC LIMIT ?"
+    _SQL_DELETE = "DELETE FROM topics WHERE id = ?"
+    _SQL_EXISTS = "SELECT EXISTS(SELECT 1 FROM topics WHERE id = ?)"
+
+    # トピックと最新のニュースデータ・記事を1回のクエリで取得
+    _TOPIC_WIDTH = len(_SELECT_COLS.split(", "))
+    _NEWS_WIDTH = len(NewsRepository._SELECT_COLS.split(", "))
+    _SQL_GET_BUNDLE = (
+        "SELECT "
+        + ", ".join(
+            [f"t.{col}" for col in _SELECT_COLS.split(", ")]
+            + [f"n.{col}" for col in NewsRepository._SELECT_COLS.split(", ")]
+            + [f"a.{col}" for col in ArticleRepository._SELECT_COLS.split(", ")]
+        )
+        + " FROM topics t"
+        " LEFT JOIN news_data n ON n.id = ("
+        "SELECT id FROM news_data WHERE topic_id = t.id"
+        " ORDER BY created_at DESC, id DESC LIMIT 1)"
+        " LEFT JOIN articles a ON a.id = ("
+        "SELECT id FROM articles WHERE topic_id = t.id AND status != 'streaming'"
+        " ORDER BY created_at DESC, id DESC LIMIT 1)"
+        " WHERE t.id = ?"
+    )
+
+    # トピック・ニュースデータの有無・関連する記事（新しい順）を1回のクエリで取得
+    # （記事がない場合も、記事の列が NULL の行が1行返る。生成中の記事は含めない）
+    _SQL_GET_DETAILS = (
+        "SELECT "
+        + ", ".join(
+            [f"t.{col}" for col in _SELECT_COLS.split(", ")]
+            + ["EXISTS(SELECT 1 FROM news_data WHERE topic_id = t.id)"]
+            + [f"a.{col}" for col in ArticleRepository._SELECT_COLS.split(", ")]
+        )
+        + " FROM topics t"
+        " LEFT JOIN articles a ON a.topic_id = t.id AND a.status != 'streaming'"
+        " WHERE t.id = ?"
+        " ORDER BY a.created_at DESC, a.id DESC"
+    )
+
     def __init__(self, db_manager: DatabaseManager):
         """
         リポジトリの初期化
@@ -18,6 +78,25 @@ class TopicRepository:
         """
         self.db_manager = db_manager
 
+    @staticmethod
+    def _row_to_topic(row: tuple) -> Topic:
+        """
+        _SELECT_COLS の順に並んだ行をトピックに変換
+
+        Args:
+            row: 取得した行
+
+        Returns:
+            Topic: トピック
+        """
+        return Topic(
+            id=row[0],
+            title=row[1],
+            description=row[2],
+            created_at=_fromts(row[3]),
+            updated_at=_fromts(row[4]),
+        )
+
     def create(self, topic: Topic) -> Topic:
         """
         トピックを作成
@@ -28,23 +107,44 @@ class TopicRepository:
         Returns:
             Topic: 作成されたトピック（IDが設定される）
         """
-        conn = self.db_manager.get_connection()
-        cursor = conn.cursor()
+        now = int(time.time())
+        now_dt = _fromts(now)
 
-        now = datetime.now().isoformat()
+        with self.db_manager.transaction() as cursor:
+            cursor.execute(self._SQL_INSERT, (topic.title, topic.description, now, now))
 
-        cursor.execute(
-            "INSERT INTO topics (title, description, created_at, updated_at) VALUES (?, ?, ?, ?)",
-            (topic.title, topic.description, now, now),
-        )
-
-        conn.commit()
         topic.id = cursor.lastrowid
-        topic.created_at = datetime.fromisoformat(now)
-        topic.updated_at = datetime.fromisoformat(now)
+        topic.created_at = now_dt
+        topic.updated_at = now_dt
 
         return topic
 
+    def create_many(self, topics: List[Topic]) -> List[Topic]:
+        """
+        複数のトピックを1つのトランザクションでまとめて作成
+
+        Args:
+            topics: 作成するトピックのリスト
+
+        Returns:
+            List[Topic]: 作成されたトピック（IDが設定される）
+        """
+        if not topics:
+            return []
+
+        now = int(time.time())
+        now_dt = _fromts(now)
+        rows = [(topic.title, topic.description, now, now) for topic in topics]
+
+        ids = self.db_manager.insert_many(self._TABLE, self._INSERT_COLS, rows)
+
+        for topic, topic_id in zip(topics, ids):
+            topic.id = topic_id
+            topic.created_at = now_dt
+            topic.updated_at = now_dt
+
+        return topics
+
     def get_by_id(self, topic_id: int) -> Optional[Topic]:
         """
         IDによるトピックの取得
@@ -55,21 +155,67 @@ class TopicRepository:
         Returns:
             Optional[Topic]: 見つかったトピック、または None
         """
-        conn = self.db_manager.get_connection()
-        cursor = conn.cursor()
+        conn = self.db_manager.get_readonly_connection()
+        row = conn.execute(self._SQL_GET_BY_ID, (topic_id,)).fetchone()
 
-        cursor.execute("SELECT * FROM topics WHERE id = ?", (topic_id,))
-        row = cursor.fetchone()
+        if row is None:
+            return None
+
+        return self._row_to_topic(row)
+
+    def get_bundle(self, topic_id: int) -> Optional[TopicBundle]:
+        """
+        トピックと、それに紐づく最新のニュースデータ・記事をまとめて取得
+
+        Args:
+            topic_id: 取得するトピックのID
+
+        Returns:
+            Optional[TopicBundle]: 見つかったトピックのバンドル、または None
+        """
+        conn = self.db_manager.get_readonly_connection()
+        row = conn.execute(self._SQL_GET_BUNDLE, (topic_id,)).fetchone()
 
         if row is None:
             return None
 
-        return Topic(
-            id=row["id"],
-            title=row["title"],
-            description=row["description"],
-            created_at=datetime.fromisoformat(row["created_at"]),
-            updated_at=datetime.fromisoformat(row["updated_at"]),
+        news_start = self._TOPIC_WIDTH
+        article_start = news_start + self._NEWS_WIDTH
+        return TopicBundle(
+            topic=self._row_to_topic(row[:news_start]),
+            news_data=NewsRepository._row_to_news_data(row[news_start:article_start])
+            if row[news_start] is not None
+            else None,
+            article=ArticleRepository._row_to_article(row[article_start:])
+            if row[article_start] is not None
+            else None,
+        )
+
+    def get_details(self, topic_id: int) -> Optional[TopicDetails]:
+        """
+        トピックと、ニュースデータの有無・関連する記事（生成中のものを除く）の一覧をまとめて取得
+
+        Args:
+            topic_id: 取得するトピックのID
+
+        Returns:
+            Optional[TopicDetails]: 見つかったトピックの詳細、または None
+        """
+        conn = self.db_manager.get_readonly_connection()
+        rows = conn.execute(self._SQL_GET_DETAILS, (topic_id,)).fetchall()
+
+        if not rows:
+            return None
+
+        article_start = self._TOPIC_WIDTH + 1
+        return TopicDetails(
+            topic=self._row_to_topic(rows[0][: self._TOPIC_WIDTH]),
+            has_news=bool(rows[0][self._TOPIC_WIDTH]),
+            articles=[
+                ArticleRepository._row_to_article(row[article_start:])
+                for row in rows
+                if row[article_start] is not None
+            ],
         )
 
     def get_all(self) -> List[Topic]:
@@ -79,22 +225,23 @@ class TopicRepository:
         Returns:
             List[Topic]: トピックのリスト
         """
-        conn = self.db_manager.get_connection()
-        cursor = conn.cursor()
+        conn = self.db_manager.get_readonly_connection()
+        rows = conn.execute(self._SQL_GET_ALL).fetchall()
 
-        cursor.execute("SELECT * FROM topics ORDER BY created_at DESC")
-        rows = cursor.fetchall()
+        return [self._row_to_topic(row) for row in rows]
 
-        return [
-            Topic(
-                id=row["id"],
-                title=row["title"],
-                description=row["description"],
-                created_at=datetime.fromisoformat(row["created_at"]),
-                updated_at=datetime.fromisoformat(row["updated_at"]),
-            )
-            for row in rows
-        ]
+    def get_choices(self, limit: int = 200) -> List[Tuple[int, str]]:
+        """
+        選択肢の表示用にトピックのIDとタイトルのみを取得（新しい順）
+
+        Args:
+            limit: 取得する最大件数
+
+        Returns:
+            List[Tuple[int, str]]: (ID, タイトル) のリスト
+        """
+        conn = self.db_manager.get_readonly_connection()
+        return conn.execute(self._SQL_GET_CHOICES, (limit,)).fetchall()
 
     def update(self, topic: Topic) -> Topic:
         """
@@ -106,20 +253,30 @@ class TopicRepository:
         Returns:
             Topic: 更新されたトピック
         """
-        conn = self.db_manager.get_connection()
-        cursor = conn.cursor()
-
-        now = datetime.now().isoformat()
-        topic.updated_at = datetime.fromisoformat(now)
+        now = int(time.time())
+        now_dt = _fromts(now)
+        topic.updated_at = now_dt
 
-        cursor.execute(
-            "UPDATE topics SET title = ?, description = ?, updated_at = ? WHERE id = ?",
-            (topic.title, topic.description, now, topic.id),
-        )
+        with self.db_manager.transaction() as cursor:
+            cursor.execute(
+                self._SQL_UPDATE, (topic.title, topic.description, now, topic.id)
+            )
 
-        conn.commit()
         return topic
 
+    def exists(self, topic_id: int) -> bool:
+        """
+        トピックが存在するかを確認（行の内容は読み込まない）
+
+        Args:
+            topic_id: 確認するトピックのID
+
+        Returns:
+            bool: 存在するかどうか
+        """
+        conn = self.db_manager.get_readonly_connection()
+        return bool(conn.execute(self._SQL_EXISTS, (topic_id,)).fetchone()[0])
+
     def delete(self, topic_id: int) -> bool:
         """
         トピックの削除
@@ -128,12 +285,13 @@ class TopicRepository:
             topic_id: 削除するトピックのID
 
         Returns:
-            bool: 削除が成功したかどうか
+            bool: 削除が成功したかどうか（ニュースデータや記事から参照されている場合は削除せず False）
         """
-        conn = self.db_manager.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("DELETE FROM topics WHERE id = ?", (topic_id,))
-        conn.commit()
+        try:
+            with self.db_manager.transaction() as cursor:
+                cursor.execute(self._SQL_DELETE, (topic_id,))
+        except sqlite3.IntegrityError:
+            # 外部キー制約（foreign_keys = ON）により参照されている行は削除できない
+            return False
 
         return cursor.rowcount > 0
@@ -0,0 +1,57 @@
+# scripts/compile_env.py
+"""
+.env ファイルを Python モジュール（_env_cache.py）に変換するスクリプト
+
+生成されたモジュールは .pyc としてキャッシュされるため、起動時に .env を
+毎回解析する必要がなくなる。.env を更新した場合は再実行すること
+（更新時刻が一致しないキャッシュは config.py 側で無視される）。
+
+使い方:
+    python scripts/compile_env.py
+"""
+
+import os
+import sys
+
+from dotenv import dotenv_values
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENV_FILE = os.path.join(ROOT_DIR, ".env")
+OUTPUT_FILE = os.path.join(ROOT_DIR, "_env_cache.py")
+
+
+def compile_env(env_file: str = ENV_FILE, output_file: str = OUTPUT_FILE) -> int:
+    """
+    .env ファイルを読み込み、辞書リテラルを持つモジュールとして書き出す
+
+    Args:
+        env_file: 読み込む .env ファイルのパス
+        output_file: 出力するモジュールのパス
+
+    Returns:
+        int: 書き出した環境変数の数
+    """
+    values = {k: v for k, v in dotenv_values(env_file).items() if v is not None}
+    mtime_ns = os.stat(env_file).st_mtime_ns
+
+    lines = [
+        "# このファイルは scripts/compile_env.py により自動生成されます。編集しないでください。",
+        f"ENV_MTIME_NS = {mtime_ns!r}",
+        "ENV = {",
+        *(f"    {key!r}: {value!r}," for key, value in values.items()),
+        "}",
+        "",
+    ]
+    with open(output_file, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines))
+
+    return len(values)
+
+
+if __name__ == "__main__":
+    if not os.path.exists(ENV_FILE):
+        print(f".env ファイルが見つかりません: {ENV_FILE}", file=sys.stderr)
+        sys.exit(1)
+
+    count = compile_env()
+    print(f"{OUTPUT_FILE} を生成しました（{count}件）")
@@ -1,17 +1,56 @@
 # services/app_service.py
+import asyncio
+import contextvars
+import functools
 import logging
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 from models.article import Article
 from models.news_data import NewsData
 from models.topic import Topic
+from models.topic_bundle import TopicBundle
+from models.topic_details import TopicDetails
 from repositories.article_repository import ArticleRepository
 from repositories.news_repository import NewsRepository
 from repositories.topic_repository import TopicRepository
 from services.article_service import ArticleService
 from services.note_poster_service import NotePosterService
-from services.search_service import SearchService
+from services.search_service import BaseSearchService
+
+# run_full_process の実行中だけ有効なリポジトリ取得結果のキャッシュ
+# （並行実行される各処理が別々のキャッシュを持つよう ContextVar で保持する）
+_request_cache: contextvars.ContextVar[Optional[Dict[Tuple[str, Any], Any]]] = (
+    contextvars.ContextVar("request_cache", default=None)
+)
+
+
+def requires_topic(fn: Callable) -> Callable:
+    """
+    topic_id のトピックを取得・検証してから処理を呼び出すデコレータ
+
+    bundle が指定されていない場合はトピックのバンドルを1回のクエリで取得し、
+    トピックが存在しなければ ValueError を送出する。
+
+    Args:
+        fn: (self, topic_id, bundle) を受け取る非同期メソッド
+
+    Returns:
+        Callable: bundle を省略可能にしたメソッド
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(
+        self: "AppService", topic_id: int, bundle: Optional[TopicBundle] = None
+    ) -> Any:
+        if bundle is None:
+            bundle = await self.db_manager.run(self.topic_repo.get_bundle, topic_id)
+        if not bundle:
+            raise ValueError(f"トピックID {topic_id} が見つかりません")
+        return await fn(self, topic_id, bundle)
+
+    return wrapper
 
 
 class AppService:
@@ -22,7 +61,7 @@ class AppService:
         topic_repo: TopicRepository,
         news_repo: NewsRepository,
         article_repo: ArticleRepository,
-        search_service: SearchService,
+        search_service: BaseSearchService,
         article_service: ArticleService,
         note_poster_service: Optional[NotePosterService] = None,
     ):
@@ -43,6 +82,8 @@ class AppService:
         self.search_service = search_service
         self.article_service = article_service
         self.note_poster_service = note_poster_service
+        # データベース操作を専用スレッドで実行するため（リポジトリは同じ管理クラスを共有する）
+        self.db_manager = topic_repo.db_manager
 
         # ステップ実行状態の追跡
         self.step_status = {
@@ -52,12 +93,33 @@ class AppService:
             "article_improved": False,
             "article_published": False,
         }
+        # get_step_status で返す読み取り専用ビュー（step_status の変更がそのまま反映される）
+        self._step_status_view = MappingProxyType(self.step_status)
 
         # 現在のオブジェクトID
         self.current_topic_id = None
         self.current_news_id = None
         self.current_article_id = None
 
+    def prepare_pool(self) -> None:
+        """呼び出したスレッドのデータベース接続を作成しておく（最初の操作で接続を待たないよう起動時に呼ぶ）"""
+        self.topic_repo.db_manager.get_connection()
+
+    def _mark(self, **values: Any) -> None:
+        """
+        実行状態と現在のオブジェクトIDをまとめて更新
+
+        Args:
+            **values: step_status のキー、または current_topic_id などの属性名と値
+        """
+        for key, value in values.items():
+            if key in self.step_status:
+                self.step_status[key] = value
+            elif key in ("current_topic_id", "current_news_id", "current_article_id"):
+                setattr(self, key, value)
+            else:
+                raise KeyError(key)
+
     def create_topic(self, title: str, description: Optional[str] = None) -> Topic:
         """
         トピックを作成
@@ -73,12 +135,14 @@ class AppService:
         created_topic = self.topic_repo.create(topic)
 
         # 実行状態を更新
-        self.step_status["topic_created"] = True
-        self.current_topic_id = created_topic.id
-        self.step_status["news_collected"] = False
-        self.step_status["article_created"] = False
-        self.step_status["article_improved"] = False
-        self.step_status["article_published"] = False
+        self._mark(
+            topic_created=True,
+            current_topic_id=created_topic.id,
+            news_collected=False,
+            article_created=False,
+            article_improved=False,
+            article_published=False,
+        )
 
         return created_topic
 
@@ -91,70 +155,261 @@ class AppService:
         """
         return self.topic_repo.get_all()
 
-    async def collect_news_for_topic(self, topic_id: int) -> NewsData:
+    def get_topic_choices(self, limit: int = 200) -> List[Tuple[int, str]]:
+        """
+        選択肢の表示用にトピックのIDとタイトルを取得（新しい順）
+
+        Args:
+            limit: 取得する最大件数
+
+        Returns:
+            List[Tuple[int, str]]: (ID, タイトル) のリスト
+        """
+        return self.topic_repo.get_choices(limit)
+
+    def get_topic_details(self, topic_id: int) -> Optional[TopicDetails]:
+        """
+        トピックと、ニュースデータの有無・関連する記事の一覧を1回の問い合わせで取得
+
+        Args:
+            topic_id: トピックID
+
+        Returns:
+            Optional[TopicDetails]: トピックの詳細、または None
+        """
+        return self.topic_repo.get_details(topic_id)
+
+    def find_recent_article(
+        self, title: str, description: Optional[str], max_age: float
+    ) -> Optional[Article]:
+        """
+        同じタイトル・説明のトピックで最近作成された記事を取得
+
+        Args:
+            title: トピックのタイトル
+            description: トピックの説明（任意）
+            max_age: 対象にする記事の作成からの経過時間の上限（秒）
+
+        Returns:
+            Optional[Article]: 見つかった記事、または None
+        """
+        since = datetime.now() - timedelta(seconds=max_age)
+        return self.article_repo.get_latest_by_topic_text(title, description, since)
+
+    def _cached(self, getter: Callable[[Any], Any], key: Any) -> Any:
+        """
+        リポジトリの取得結果を、実行中の run_full_process の間だけキャッシュする
+
+        Args:
+            getter: リポジトリの取得メソッド（例: self.article_repo.get_by_id）
+            key: 取得メソッドに渡すキー
+
+        Returns:
+            Any: 取得結果
+        """
+        cache = _request_cache.get()
+        if cache is None:
+            return getter(key)
+
+        cache_key = (getter.__qualname__, key)
+        if cache_key not in cache:
+            cache[cache_key] = getter(key)
+        return cache[cache_key]
+
+    async def _cached_async(self, getter: Callable[[Any], Any], key: Any) -> Any:
+        """
+        _cached の非同期版（キャッシュにない場合はデータベース専用スレッドで取得する）
+
+        Args:
+            getter: リポジトリの取得メソッド（例: self.article_repo.get_by_id）
+            key: 取得メソッドに渡すキー
+
+        Returns:
+            Any: 取得結果
+        """
+        cache = _request_cache.get()
+        if cache is None:
+            return await self.db_manager.run(getter, key)
+
+        cache_key = (getter.__qualname__, key)
+        if cache_key not in cache:
+            cache[cache_key] = await self.db_manager.run(getter, key)
+        return cache[cache_key]
+
+    def _remember(self, getter: Callable[[Any], Any], key: Any, value: Any) -> None:
+        """
+        作成・更新したオブジェクトを実行中のキャッシュに登録する
+
+        Args:
+            getter: 対応するリポジトリの取得メソッド
+            key: 取得メソッドに渡すキー
+            value: 登録するオブジェクト
+        """
+        cache = _request_cache.get()
+        if cache is not None:
+            cache[(getter.__qualname__, key)] = value
+
+    @requires_topic
+    async def collect_news_for_topic(
+        self, topic_id: int, bundle: Optional[TopicBundle] = None
+    ) -> NewsData:
         """
         トピックに関するニュースを収集
 
         Args:
             topic_id: トピックID
+            bundle: 取得済みのトピックのバンドル（任意、指定時は再取得しない）
 
         Returns:
             NewsData: 収集されたニュースデータ
         """
-        topic = self.topic_repo.get_by_id(topic_id)
-        if not topic:
-            raise ValueError(f"トピックID {topic_id} が見つかりません")
+        topic = bundle.topic
 
         # 既存のニュースデータを取得
-        existing_news = self.news_repo.get_by_topic_id(topic_id)
+        existing_news = bundle.news_data
         if existing_news:
             logging.info(f"トピックID {topic_id} の既存ニュースデータを使用します")
 
             # 実行状態を更新
-            self.step_status["topic_created"] = True
-            self.current_topic_id = topic_id
-            self.step_status["news_collected"] = True
-            self.current_news_id = existing_news.id
+            self._mark(
+                topic_created=True,
+                current_topic_id=topic_id,
+                news_collected=True,
+                current_news_id=existing_news.id,
+            )
 
             return existing_news
 
         # 新規にニュースデータを収集
         news_data = await self.search_service.search_topic(topic)
-        created_news = self.news_repo.create(news_data)
+        created_news = await self.db_manager.run(self.news_repo.create, news_data)
+        bundle.news_data = created_news
 
         # 実行状態を更新
-        self.step_status["topic_created"] = True
-        self.current_topic_id = topic_id
-        self.step_status["news_collected"] = True
-        self.current_news_id = created_news.id
+        self._mark(
+            topic_created=True,
+            current_topic_id=topic_id,
+            news_collected=True,
+            current_news_id=created_news.id,
+        )
 
         return created_news
 
-    async def create_article_for_topic(self, topic_id: int) -> Article:
+    @requires_topic
+    async def create_article_for_topic(
+        self, topic_id: int, bundle: Optional[TopicBundle] = None
+    ) -> Article:
         """
         トピックの記事を作成
 
         Args:
             topic_id: トピックID
+            bundle: 取得済みのトピックのバンドル（任意、指定時は再取得しない）
 
         Returns:
             Article: 作成された記事
         """
-        topic = self.topic_repo.get_by_id(topic_id)
-        if not topic:
-            raise ValueError(f"トピックID {topic_id} が見つかりません")
+        topic = bundle.topic
 
         # 既存のニュースデータを取得
-        news_data = self.news_repo.get_by_topic_id(topic_id)
+        news_data = bundle.news_data
         if not news_data:
             # ニュースデータがなければ収集
-            news_data = await self.collect_news_for_topic(topic_id)
+            news_data = await self.collect_news_for_topic(topic_id, bundle)
+
+        # タイトルが確定した時点で生成中の記事を保存し、生成と並行して一覧に表示できるようにする
+        # （保存はデータベース専用スレッドで行い、受信中のイベントループを止めない）
+        saving: List[asyncio.Future] = []
+
+        def on_title(title: str) -> None:
+            saving.append(
+                asyncio.ensure_future(
+                    self.db_manager.run(
+                        self.article_repo.create,
+                        Article(
+                            topic_id=topic.id,
+                            news_data_id=news_data.id,
+                            title=title,
+                            status="streaming",
+                        ),
+                    )
+                )
+            )
 
         # 記事を作成
-        article = await self.article_service.create_article_from_news(topic, news_data)
-        return self.article_repo.create(article)
+        try:
+            article = await self.article_service.create_article_from_news(
+                topic, news_data, on_title=on_title
+            )
+            streaming_articles = [await future for future in saving]
+        except BaseException:
+            # 生成に失敗・キャンセルされた場合は途中で保存した記事を残さない
+            # （Gradio の中断や切断は CancelledError になるため BaseException で捕捉する）
+            for future in saving:
+                try:
+                    streaming_article = await future
+                    await self.db_manager.run(
+                        self.article_repo.delete, streaming_article.id
+                    )
+                except Exception as e:
+                    logging.warning(f"生成中の記事を削除できませんでした: {e}")
+            raise
+
+        if streaming_articles:
+            article.id = streaming_articles[0].id
+            article.created_at = streaming_articles[0].created_at
+            created_article = await self.db_manager.run(
+                self.article_repo.update, article
+            )
+        else:
+            created_article = await self.db_manager.run(
+                self.article_repo.create, article
+            )
+        bundle.article = created_article
+        self._remember(self.article_repo.get_by_id, created_article.id, created_article)
+        return created_article
+
+    @requires_topic
+    async def create_and_improve_article_for_topic(
+        self, topic_id: int, bundle: Optional[TopicBundle] = None
+    ) -> Article:
+        """
+        トピックの記事を作成し、改善まで1回のAPI呼び出しで行う
+
+        Args:
+            topic_id: トピックID
+            bundle: 取得済みのトピックのバンドル（任意、指定時は再取得しない）
+
+        Returns:
+            Article: 作成・改善された記事
+        """
+        topic = bundle.topic
+
+        # 既存のニュースデータを取得
+        news_data = bundle.news_data
+        if not news_data:
+            # ニュースデータがなければ収集
+            news_data = await self.collect_news_for_topic(topic_id, bundle)
 
-    def improve_article(self, article_id: int) -> Article:
+        # 記事を作成・改善
+        article = await self.article_service.create_and_improve(topic, news_data)
+        created_article = await self.db_manager.run(self.article_repo.create, article)
+        bundle.article = created_article
+        self._remember(self.article_repo.get_by_id, created_article.id, created_article)
+
+        # 実行状態を更新
+        self._mark(
+            topic_created=True,
+            current_topic_id=topic_id,
+            news_collected=True,
+            article_created=True,
+            current_article_id=created_article.id,
+            article_improved=True,
+        )
+
+        return created_article
+
+    async def improve_article(self, article_id: int) -> Article:
         """
         記事を改善
 
@@ -164,7 +419,7 @@ class AppService:
         Returns:
             Article: 改善された記事
         """
-        article = self.article_repo.get_by_id(article_id)
+        article = await self._cached_async(self.article_repo.get_by_id, article_id)
         if not article:
             raise ValueError(f"記事ID {article_id} が見つかりません")
 
@@ -173,26 +428,33 @@ class AppService:
             logging.info(f"記事ID {article_id} は既に改善されています")
 
             # 実行状態を更新
-            self.step_status["topic_created"] = True
-            self.current_topic_id = article.topic_id
-            self.step_status["news_collected"] = True
-            self.step_status["article_created"] = True
-            self.current_article_id = article_id
-            self.step_status["article_improved"] = True
+            self._mark(
+                topic_created=True,
+                current_topic_id=article.topic_id,
+                news_collected=True,
+                article_created=True,
+                current_article_id=article_id,
+                article_improved=True,
+            )
 
             return article
 
         # 記事を改善
-        improved_article = self.article_service.improve_article(article)
-        updated_article = self.article_repo.update(improved_article)
+        improved_article = await self.article_service.improve_article(article)
+        updated_article = await self.db_manager.run(
+            self.article_repo.update, improved_article
+        )
+        self._remember(self.article_repo.get_by_id, article_id, updated_article)
 
         # 実行状態を更新
-        self.step_status["topic_created"] = True
-        self.current_topic_id = article.topic_id
-        self.step_status["news_collected"] = True
-        self.step_status["article_created"] = True
-        self.current_article_id = article_id
-        self.step_status["article_improved"] = True
+        self._mark(
+            topic_created=True,
+            current_topic_id=article.topic_id,
+            news_collected=True,
+            article_created=True,
+            current_article_id=article_id,
+            article_improved=True,
+        )
 
         return updated_article
 
@@ -209,7 +471,7 @@ class AppService:
         if not self.note_poster_service:
             raise ValueError("Note投稿サービスが設定されていません")
 
-        article = self.article_repo.get_by_id(article_id)
+        article = self._cached(self.article_repo.get_by_id, article_id)
         if not article:
             raise ValueError(f"記事ID {article_id} が見つかりません")
 
@@ -218,13 +480,15 @@ class AppService:
             logging.info(f"記事ID {article_id} は既に投稿済みです")
 
             # 実行状態を更新
-            self.step_status["topic_created"] = True
-            self.current_topic_id = article.topic_id
-            self.step_status["news_collected"] = True
-            self.step_status["article_created"] = True
-            self.current_article_id = article_id
-            self.step_status["article_improved"] = article.improved_content is not None
-            self.step_status["article_published"] = True
+            self._mark(
+                topic_created=True,
+                current_topic_id=article.topic_id,
+                news_collected=True,
+                article_created=True,
+                current_article_id=article_id,
+                article_improved=article.improved_content is not None,
+                article_published=True,
+            )
 
             return True
 
@@ -234,15 +498,18 @@ class AppService:
             article.status = "published"
             article.published_at = datetime.now()
             self.article_repo.update(article)
+            self._remember(self.article_repo.get_by_id, article_id, article)
 
             # 実行状態を更新
-            self.step_status["topic_created"] = True
-            self.current_topic_id = article.topic_id
-            self.step_status["news_collected"] = True
-            self.step_status["article_created"] = True
-            self.current_article_id = article_id
-            self.step_status["article_improved"] = article.improved_content is not None
-            self.step_status["article_published"] = True
+            self._mark(
+                topic_created=True,
+                current_topic_id=article.topic_id,
+                news_collected=True,
+                article_created=True,
+                current_article_id=article_id,
+                article_improved=article.improved_content is not None,
+                article_published=True,
+            )
 
         return success
 
@@ -251,6 +518,7 @@ class AppService:
         topic_title: str,
         topic_description: Optional[str] = None,
         post_to_note: bool = False,
+        on_message: Optional[Callable[[str], None]] = None,
     ) -> Dict[str, Any]:
         """
         トピック作成から記事投稿までの全プロセスを実行
@@ -259,6 +527,7 @@ class AppService:
             topic_title: トピックのタイトル
             topic_description: トピックの説明（任意）
             post_to_note: Noteに投稿するかどうか
+            on_message: 進捗メッセージが追加されるたびにそのメッセージを受け取るコールバック
 
         Returns:
             Dict: プロセスの結果情報
@@ -273,57 +542,281 @@ class AppService:
             "note_posted": False,
         }
 
+        def add_message(message: str) -> None:
+            result["messages"].append(message)
+            if on_message is not None:
+                on_message(message)
+
+        # この実行の間はリポジトリから取得したオブジェクトを再利用する
+        cache_token = _request_cache.set({})
         try:
-            # 1. トピック作成
-            topic = self.create_topic(topic_title, topic_description)
+            # 1. トピック作成（DBへの書き込みはイベントループを止めないよう別スレッドで実行）
+            topic = await self.db_manager.run(
+                self.create_topic, topic_title, topic_description
+            )
             result["topic"] = topic
-            result["messages"].append(f"トピック「{topic.title}」を作成しました")
+            add_message(f"トピック「{topic.title}」を作成しました")
+
+            # 作成したばかりのトピックにはニュースも記事もないため、
+            # 以降のステップではDBを再検索せずこのバンドルを引き継ぐ
+            bundle = TopicBundle(topic=topic)
 
             # 2. ニュース収集
-            news_data = await self.collect_news_for_topic(topic.id)
+            news_data = await self.collect_news_for_topic(topic.id, bundle)
             result["news_data"] = news_data
-            result["messages"].append(
+            add_message(
                 f"トピック「{topic.title}」の情報を収集しました（情報源: {len(news_data.sources)}件）"
             )
 
-            # 3. 記事作成
-            article = await self.create_article_for_topic(topic.id)
-            result["article"] = article
-            result["messages"].append(f"記事「{article.title}」を作成しました")
+            # 3-4. 記事作成と改善（1回のAPI呼び出しでまとめて行う）
+            try:
+                improved_article = await self.create_and_improve_article_for_topic(
+                    topic.id, bundle
+                )
+                result["article"] = improved_article
+                add_message(f"記事「{improved_article.title}」を作成しました")
+            except ValueError as e:
+                # 応答を解析できなかった場合のみ作成と改善を個別に実行
+                # （json.JSONDecodeError も ValueError のサブクラス。
+                #   認証エラーやレート制限などは外側で処理する）
+                logging.warning(
+                    f"記事の作成と改善をまとめて実行できませんでした。個別に実行します: {str(e)}"
+                )
+
+                # 3. 記事作成
+                article = await self.create_article_for_topic(topic.id, bundle)
+                result["article"] = article
+                add_message(f"記事「{article.title}」を作成しました")
+
+                # 4. 記事改善
+                improved_article = await self.improve_article(article.id)
 
-            # 4. 記事改善
-            improved_article = await self.improve_article(article.id)
             result["improved_article"] = improved_article
-            result["messages"].append(f"記事「{improved_article.title}」を改善しました")
+            add_message(f"記事「{improved_article.title}」を改善しました")
 
             # 5. Noteに投稿（オプション）
             if post_to_note and self.note_poster_service:
-                note_posted = await self.post_article_to_note(improved_article.id)
+                # 同期のPlaywright処理はイベントループを止めないよう別スレッドで実行
+                note_posted = await asyncio.to_thread(
+                    self.post_article_to_note, improved_article.id
+                )
                 result["note_posted"] = note_posted
                 if note_posted:
-                    result["messages"].append(
-                        f"記事「{improved_article.title}」をNoteに投稿しました"
-                    )
+                    add_message(f"記事「{improved_article.title}」をNoteに投稿しました")
                 else:
-                    result["messages"].append("Noteへの投稿に失敗しました")
+                    add_message("Noteへの投稿に失敗しました")
 
         except Exception as e:
             result["success"] = False
-            result["messages"].append(f"エラー: {str(e)}")
+            add_message(f"エラー: {str(e)}")
             logging.error(
                 f"プロセス実行中にエラーが発生しました: {str(e)}", exc_info=True
             )
+        finally:
+            _request_cache.reset(cache_token)
 
         return result
 
-    def get_step_status(self) -> Dict[str, bool]:
+    async def run_full_process_many(
+        self,
+        topics: List[Tuple[str, Optional[str]]],
+        post_to_note: bool = False,
+        max_concurrency: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """
+        複数のトピックについて全プロセスを並行して実行
+
+        Args:
+            topics: (タイトル, 説明) のリスト
+            post_to_note: Noteに投稿するかどうか
+            max_concurrency: 同時に実行するトピック数の上限
+
+        Returns:
+            List[Dict]: トピックごとのプロセスの結果情報（topics と同じ順序）
+        """
+        return await self.run_batch(
+            [(title, description, post_to_note) for title, description in topics],
+            max_concurrency,
+        )
+
+    async def run_batch(
+        self,
+        topics: List[Tuple[str, Optional[str], bool]],
+        max_concurrency: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """
+        トピックごとに投稿の有無を指定して全プロセスを並行して実行
+
+        APIのレート制限を超えないよう、同時実行数は max_concurrency までに制限する。
+        1件が例外で終了しても他のトピックの処理は継続する。
+        step_status と current_*_id は最後に更新したトピックの値になる。
+
+        Args:
+            topics: (タイトル, 説明, Noteに投稿するかどうか) のリスト
+            max_concurrency: 同時に実行するトピック数の上限
+
+        Returns:
+            List[Dict]: トピックごとのプロセスの結果情報（topics と同じ順序）
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(
+            title: str, description: Optional[str], post_to_note: bool
+        ) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.run_full_process(title, description, post_to_note)
+
+        results = await asyncio.gather(
+            *(run_one(*topic) for topic in topics), return_exceptions=True
+        )
+
+        # 例外で終了したトピックは失敗として結果に変換
+        for i, result in enumerate(results):
+            if isinstance(result, BaseException):
+                logging.error(
+                    f"トピック「{topics[i][0]}」の処理中にエラーが発生しました: {str(result)}"
+                )
+                results[i] = {
+                    "success": False,
+                    "messages": [f"エラー: {str(result)}"],
+                    "topic": None,
+                    "news_data": None,
+                    "article": None,
+                    "improved_article": None,
+                    "note_posted": False,
+                }
+
+        return results
+
+    async def run_full_process_batch(
+        self,
+        topics: List[Tuple[str, Optional[str]]],
+        max_concurrency: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """
+        複数のトピックについて記事の改善までをまとめて実行
+
+        各ステップの外部API呼び出しはトピック間で並行に行い、
+        DBへの保存はテーブルごとに1回のトランザクションにまとめる。
+        Noteへの投稿は行わない。途中で失敗したトピックは以降のステップから除外する。
+
+        Args:
+            topics: (タイトル, 説明) のリスト
+            max_concurrency: 同時に実行する外部API呼び出しの上限
+
+        Returns:
+            List[Dict]: トピックごとのプロセスの結果情報（topics と同じ順序）
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def limited(coro):
+            async with semaphore:
+                return await coro
+
+        results = [
+            {
+                "success": True,
+                "messages": [],
+                "topic": None,
+                "news_data": None,
+                "article": None,
+                "improved_article": None,
+                "note_posted": False,
+            }
+            for _ in topics
+        ]
+
+        def fail(index: int, error: BaseException) -> None:
+            results[index]["success"] = False
+            results[index]["messages"].append(f"エラー: {str(error)}")
+            logging.error(
+                f"トピック「{topics[index][0]}」の処理中にエラーが発生しました: {str(error)}"
+            )
+
+        active = list(range(len(topics)))
+
+        def keep_succeeded(outcomes: List[Any]) -> List[Any]:
+            # 失敗したトピックを以降のステップから除外し、成功した結果だけを返す
+            succeeded = []
+            for i, outcome in zip(list(active), outcomes):
+                if isinstance(outcome, BaseException):
+                    fail(i, outcome)
+                    active.remove(i)
+                else:
+                    succeeded.append(outcome)
+            return succeeded
+
+        # 1. トピック作成
+        created_topics = await self.db_manager.run(
+            self.topic_repo.create_many,
+            [
+                Topic(title=title, description=description)
+                for title, description in topics
+            ],
+        )
+        for result, topic in zip(results, created_topics):
+            result["topic"] = topic
+            result["messages"].append(f"トピック「{topic.title}」を作成しました")
+
+        # 2. ニュース収集
+        collected = await asyncio.gather(
+            *(
+                limited(self.search_service.search_topic(created_topics[i]))
+                for i in active
+            ),
+            return_exceptions=True,
+        )
+        news_list = keep_succeeded(collected)
+        await self.db_manager.run(self.news_repo.create_many, news_list)
+        for i, news_data in zip(active, news_list):
+            results[i]["news_data"] = news_data
+            results[i]["messages"].append(
+                f"トピック「{created_topics[i].title}」の情報を収集しました（情報源: {len(news_data.sources)}件）"
+            )
+
+        # 3. 記事作成
+        drafted = await asyncio.gather(
+            *(
+                limited(
+                    self.article_service.create_article_from_news(
+                        created_topics[i], results[i]["news_data"]
+                    )
+                )
+                for i in active
+            ),
+            return_exceptions=True,
+        )
+        articles = keep_succeeded(drafted)
+        await self.db_manager.run(self.article_repo.create_many, articles)
+        for i, article in zip(active, articles):
+            results[i]["article"] = article
+            results[i]["messages"].append(f"記事「{article.title}」を作成しました")
+
+        # 4. 記事改善
+        improved = await asyncio.gather(
+            *(
+                limited(self.article_service.improve_article(results[i]["article"]))
+                for i in active
+            ),
+            return_exceptions=True,
+        )
+        improved_articles = keep_succeeded(improved)
+        await self.db_manager.run(self.article_repo.update_many, improved_articles)
+        for i, article in zip(active, improved_articles):
+            results[i]["improved_article"] = article
+            results[i]["messages"].append(f"記事「{article.title}」を改善しました")
+
+        return results
+
+    def get_step_status(self) -> Mapping[str, bool]:
         """
         各ステップの実行状態を取得
 
         Returns:
-            Dict[str, bool]: 各ステップの実行状態
+            Mapping[str, bool]: 各ステップの実行状態の読み取り専用ビュー
+                （その時点の値を保持したい場合は dict() でコピーする）
         """
-        return self.step_status.copy()
+        return self._step_status_view
 
     def check_topic_exists(self, topic_id: int) -> Tuple[bool, Optional[str]]:
         """
@@ -336,8 +829,7 @@ class AppService:
             Tuple[bool, Optional[str]]: (存在するか, エラーメッセージ)
         """
         try:
-            topic = self.topic_repo.get_by_id(topic_id)
-            return topic is not None, None
+            return self.topic_repo.exists(topic_id), None
         except Exception as e:
             return False, str(e)
 
@@ -352,8 +844,7 @@ class AppService:
             Tuple[bool, Optional[str]]: (存在するか, エラーメッセージ)
         """
         try:
-            news_data = self.news_repo.get_by_topic_id(topic_id)
-            return news_data is not None, None
+            return self.news_repo.exists_by_topic_id(topic_id), None
         except Exception as e:
             return False, str(e)
 
@@ -370,10 +861,10 @@ class AppService:
             Tuple[bool, Optional[str], Optional[int]]: (存在するか, エラーメッセージ, 記事ID)
         """
         try:
-            articles = self.article_repo.get_by_topic_id(topic_id)
-            if not articles:
+            article_id = self.article_repo.get_latest_id_by_topic_id(topic_id)
+            if article_id is None:
                 return False, None, None
-            return True, None, articles[0].id
+            return True, None, article_id
         except Exception as e:
             return False, str(e), None
 
@@ -390,9 +881,9 @@ class AppService:
             Tuple[bool, Optional[str]]: (存在するか, エラーメッセージ)
         """
         try:
-            article = self.article_repo.get_by_id(article_id)
-            if not article:
+            improved = self.article_repo.is_improved(article_id)
+            if improved is None:
                 return False, "記事が見つかりません"
-            return article.improved_content is not None, None
+            return improved, None
         except Exception as e:
             return False, str(e)
@@ -1,13 +1,20 @@
 # services/article_service.py
+import hashlib
+import json
 import logging
 import os
-from typing import Optional
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 from models.article import Article
 from models.news_data import NewsData
 from models.topic import Topic
+from utils.cache_utils import TTLCache
+
+# 記事の最初の見出し（# で始まる行）
+_TITLE_RE = re.compile(r"^# (.+)$", re.MULTILINE)
 
 
 class ArticleService:
@@ -21,7 +28,11 @@ class ArticleService:
             api_key: OpenAI API キー（Noneの場合は環境変数から取得）
         """
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
-        self.client = OpenAI(api_key=self.api_key)
+        # 生成待ちの間もイベントループを止めないよう非同期クライアントを使用
+        self.client = AsyncOpenAI(api_key=self.api_key)
+
+        # 同じ入力に対する生成結果のキャッシュ（再実行時のAPI呼び出しを省く）
+        self.completion_cache = TTLCache(maxsize=1024, ttl=86400)
 
         # 記事作成用のプロンプト
         self.article_prompt = """
@@ -55,8 +66,193 @@ class ArticleService:
         {article}
         """
 
+        # 記事の作成と改善を1回の呼び出しで行うためのプロンプト
+        self.combined_prompt = """
+        # 指示
+        以下の2つの手順を順に行い、結果をJSONで返してください。
+
+        ## 手順1: 下書きの作成
+        - 提供されたニュースデータをもとに、2000〜3000文字程度の記事を作成してください。
+        - 記事は 小学生高学年～中学生でも理解できるレベル で書く一方、 ビジネスマン向け の内容になるようにしてください。
+        - 各段落には参考にしたソースのリンクを記載してください。
+        - 記事には「概要」「主な登場人物」「時系列」「主な争点」「影響と今後の展開」「まとめ」を含めてください。
+        - 記事は、最初に概要や結論を述べて、その後に詳細が続く形にしてください。
+        - 絵文字やアイコンを効果的に配置（✏️📌📝🔍📊など）することで、視覚的にも分かりやすくしてください。
+
+        ## 手順2: 下書きの改善
+        下書きは有料記事としての価値が60点程度です。以下の点を改善して、100点の価値ある記事に仕上げてください：
+
+        1. 専門的な分析を追加し、深い洞察を提供する
+        2. データや具体例を追加して説得力を高める
+        3. ビジネスパーソンにとって実用的な視点や提案を盛り込む
+        4. 読みやすさ、視覚的な魅力をさらに高める
+        5. 記事の構成や流れを最適化する
+
+        改善後の記事は、単なる情報提供ではなく「この記事を読んで良かった」と思える価値を提供するものにしてください。
+
+        # 出力形式
+        次のキーを持つJSONオブジェクトのみを返してください。値はどちらもMarkdown形式の記事全体です。
+        {"draft": "手順1の記事", "improved": "手順2の記事"}
+
+        # 記事データ
+        {news_data}
+        """
+
+        # 呼び出しのたびに .format() で解析しないよう、差し込み位置の前後に分割しておく
+        self._article_head, self._article_tail = self.article_prompt.split(
+            "{news_data}"
+        )
+        self._improve_head, self._improve_tail = self.improve_prompt.split("{article}")
+        self._combined_head, self._combined_tail = self.combined_prompt.split(
+            "{news_data}"
+        )
+
+    async def _cached_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: str = "gpt-4o-mini",
+        on_title: Optional[Callable[[str], None]] = None,
+        parse: Optional[Callable[[str], Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        チャット補完を実行し、同じ入力の結果はキャッシュから返す
+
+        最後まで生成され（finish_reason が stop）、parse に成功した応答のみキャッシュする。
+
+        Args:
+            messages: 送信するメッセージ
+            model: 使用するモデル
+            on_title: 生成中に最初の見出し（# で始まる行）が確定した時点で
+                そのタイトルを受け取るコールバック（指定時はストリーミングで生成）
+            parse: 生成されたテキストを検証・変換する関数（任意、失敗時は例外を送出する）
+            **kwargs: chat.completions.create に渡す追加の引数
+
+        Returns:
+            Any: 生成されたテキスト（parse 指定時はその戻り値）
+        """
+        key = hashlib.blake2b(
+            json.dumps(
+                [model, messages, kwargs], ensure_ascii=False, sort_keys=True
+            ).encode("utf-8")
+        ).hexdigest()
+
+        cached = self.completion_cache.get(key)
+        if cached is not None:
+            logging.info("キャッシュ済みの生成結果を使用します")
+            if on_title is not None:
+                title = self._extract_title(cached, None)
+                if title:
+                    on_title(title)
+            return parse(cached) if parse is not None else cached
+
+        if on_title is None:
+            response = await self.client.chat.completions.create(
+                model=model, messages=messages, **kwargs
+            )
+            content = response.choices[0].message.content
+            finish_reason = response.choices[0].finish_reason
+        else:
+            content, finish_reason = await self._stream_completion(
+                messages, model, on_title, **kwargs
+            )
+
+        # 検証に失敗した応答はキャッシュせずに例外を送出する（再試行で再生成されるようにする）
+        result = parse(content) if parse is not None else content
+
+        # 上限に達して途中で打ち切られた応答などはキャッシュしない
+        if finish_reason == "stop":
+            self.completion_cache.set(key, content)
+        else:
+            logging.warning(
+                f"生成が完了しなかったため結果をキャッシュしません（finish_reason={finish_reason}）"
+            )
+        return result
+
+    async def _stream_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        on_title: Callable[[str], None],
+        **kwargs: Any,
+    ) -> Tuple[str, Optional[str]]:
+        """
+        チャット補完をストリーミングで受信し、タイトルが確定した時点で通知する
+
+        Args:
+            messages: 送信するメッセージ
+            model: 使用するモデル
+            on_title: 最初の見出しのタイトルを受け取るコールバック
+            **kwargs: chat.completions.create に渡す追加の引数
+
+        Returns:
+            Tuple[str, Optional[str]]: (生成されたテキスト全体, 終了理由（finish_reason）)
+        """
+        stream = await self.client.chat.completions.create(
+            model=model, messages=messages, stream=True, **kwargs
+        )
+
+        parts: List[str] = []
+        finish_reason: Optional[str] = None
+        # タイトルが見つかるまでは未完了の行を保持して見出しを探す
+        pending: Optional[str] = ""
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            # 終了理由は最後のチャンクにのみ設定される
+            if chunk.choices[0].finish_reason:
+                finish_reason = chunk.choices[0].finish_reason
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            parts.append(delta)
+
+            if pending is None:
+                continue
+            pending += delta
+            while "\n" in pending:
+                line, pending = pending.split("\n", 1)
+                if line.startswith("# "):
+                    on_title(line[2:].strip())
+                    pending = None
+                    break
+
+        return "".join(parts), finish_reason
+
+    def _format_news_data(self, news_data: NewsData) -> str:
+        """
+        ニュースデータをプロンプト用の文字列に変換
+
+        Args:
+            news_data: ニュースデータ
+
+        Returns:
+            str: プロンプトに埋め込む文字列
+        """
+        return "\n\n".join(
+            f"情報源 {i}:\nタイトル: {source.title}\nURL: {source.url}\n内容: {source.content}"
+            for i, source in enumerate(news_data.sources, 1)
+        )
+
+    def _extract_title(self, content: str, default: Optional[str]) -> Optional[str]:
+        """
+        記事の最初の見出し（# で始まる行）からタイトルを取得
+
+        Args:
+            content: Markdown形式の記事
+            default: 見出しがない場合のタイトル
+
+        Returns:
+            str: 記事のタイトル
+        """
+        match = _TITLE_RE.search(content)
+        return match.group(1).strip() if match else default
+
     async def create_article_from_news(
-        self, topic: Topic, news_data: NewsData
+        self,
+        topic: Topic,
+        news_data: NewsData,
+        on_title: Optional[Callable[[str], None]] = None,
     ) -> Article:
         """
         ニュースデータから記事を作成
@@ -64,6 +260,7 @@ class ArticleService:
         Args:
             topic: 記事のトピック
             news_data: ニュースデータ
+            on_title: 生成中にタイトルが確定した時点で呼ばれるコールバック（任意）
 
         Returns:
             Article: 作成された記事
@@ -71,16 +268,10 @@ class ArticleService:
         logging.info(f"トピック「{topic.title}」の記事を作成します")
 
         # ニュースデータを文字列に変換
-        news_text = ""
-        for i, source in enumerate(news_data.sources):
-            news_text += f"情報源 {i + 1}:\n"
-            news_text += f"タイトル: {source.title}\n"
-            news_text += f"URL: {source.url}\n"
-            news_text += f"内容: {source.content}\n\n"
+        news_text = self._format_news_data(news_data)
 
         # GPT-4を使用して記事を生成
-        response = self.client.chat.completions.create(
-            model="gpt-4o-mini",
+        content = await self._cached_completion(
             messages=[
                 {
                     "role": "system",
@@ -88,20 +279,14 @@ class ArticleService:
                 },
                 {
                     "role": "user",
-                    "content": self.article_prompt.format(news_data=news_text),
+                    "content": f"{self._article_head}{news_text}{self._article_tail}",
                 },
             ],
+            on_title=on_title,
         )
 
-        content = response.choices[0].message.content
-
         # 記事のタイトルは最初の行から取得（# で始まる行）
-        lines = content.split("\n")
-        title = topic.title
-        for line in lines:
-            if line.startswith("# "):
-                title = line[2:].strip()
-                break
+        title = self._extract_title(content, topic.title)
 
         return Article(
             topic_id=topic.id,
@@ -111,7 +296,76 @@ class ArticleService:
             status="draft",
         )
 
-    def improve_article(self, article: Article) -> Article:
+    @staticmethod
+    def _parse_combined(content: str) -> Tuple[str, str]:
+        """
+        作成・改善を同時に行った応答（JSON）から下書きと改善後の記事を取り出す
+
+        Args:
+            content: 生成されたJSON文字列
+
+        Returns:
+            Tuple[str, str]: (下書き, 改善後の記事)
+
+        Raises:
+            ValueError: JSONとして解析できない、または draft / improved が含まれていない場合
+        """
+        result = json.loads(content)
+        draft = result.get("draft") if isinstance(result, dict) else None
+        improved = result.get("improved") if isinstance(result, dict) else None
+        if not draft or not improved:
+            raise ValueError(
+                "記事の作成結果に draft または improved が含まれていません"
+            )
+        return draft, improved
+
+    async def create_and_improve(self, topic: Topic, news_data: NewsData) -> Article:
+        """
+        ニュースデータから記事を作成し、改善まで1回のAPI呼び出しで行う
+
+        Args:
+            topic: 記事のトピック
+            news_data: ニュースデータ
+
+        Returns:
+            Article: 下書きと改善後の内容が設定された記事
+
+        Raises:
+            ValueError: 応答に下書きまたは改善後の記事が含まれていない場合
+        """
+        logging.info(f"トピック「{topic.title}」の記事を作成・改善します")
+
+        news_text = self._format_news_data(news_data)
+
+        # 応答の解析に失敗した場合は _cached_completion がキャッシュせずに例外を送出する
+        draft, improved = await self._cached_completion(
+            messages=[
+                {
+                    "role": "system",
+                    "content": "あなたは優秀なビジネスライター兼エディターです。与えられた情報から記事を作成し、より価値の高いコンテンツに仕上げます。",
+                },
+                {
+                    "role": "user",
+                    "content": f"{self._combined_head}{news_text}{self._combined_tail}",
+                },
+            ],
+            parse=self._parse_combined,
+            response_format={"type": "json_object"},
+        )
+
+        # タイトルは改善後の記事の見出しを優先
+        title = self._extract_title(improved, self._extract_title(draft, topic.title))
+
+        return Article(
+            topic_id=topic.id,
+            news_data_id=news_data.id,
+            title=title,
+            content=draft,
+            improved_content=improved,
+            status="improved",
+        )
+
+    async def improve_article(self, article: Article) -> Article:
         """
         記事を改善
 
@@ -124,8 +378,7 @@ class ArticleService:
         logging.info(f"記事「{article.title}」を改善します")
 
         # GPT-4を使用して記事を改善
-        response = self.client.chat.completions.create(
-            model="gpt-4o-mini",
+        content = await self._cached_completion(
             messages=[
                 {
                     "role": "system",
@@ -133,12 +386,12 @@ class ArticleService:
                 },
                 {
                     "role": "user",
-                    "content": self.improve_prompt.format(article=article.content),
+                    "content": f"{self._improve_head}{article.content}{self._improve_tail}",
                 },
             ],
         )
 
-        improved_content = response.choices[0].message.content
+        improved_content = content
 
         # 更新された記事を返す
         article.improved_content = improved_content
@@ -1,19 +1,103 @@
 # ui/app_ui.py
-import json
+import asyncio
+import functools
 import logging
-import os
-from typing import Any, Dict, List, Optional, Union
-
-import gradio as gr
+import sys
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from config import Config
 from models.article import Article
 from services.app_service import AppService
+from utils.cache_utils import TTLCache
+from utils.queue_utils import WorkerStage
+
+logger = logging.getLogger(__name__)
+
+# 記事のステータスごとの表示用絵文字（未知のステータスは ❓）
+_STATUS_EMOJI = {"draft": "📝", "improved": "✨", "published": "🌐"}
+
+# 処理結果のメッセージに付ける接頭辞
+_STATUS_OK = sys.intern("✅ ")
+_STATUS_FAIL = sys.intern("❌ ")
+
+# 設定タブで編集できる項目とそのデフォルト値
+_SETTINGS_DEFAULTS = {
+    "OPENAI_API_KEY": "",
+    "NOTE_EMAIL": "",
+    "NOTE_PASSWORD": "",
+    "DB_PATH": "news_reports.db",
+    "LOG_LEVEL": "INFO",
+}
+
+
+def _format_datetime(dt: datetime) -> str:
+    """
+    日時を表示用の文字列（YYYY-MM-DD HH:MM:SS）に変換
+
+    strftime よりも高速な isoformat を使用する。
+
+    Args:
+        dt: 日時
+
+    Returns:
+        str: 表示用の文字列
+    """
+    return dt.isoformat(sep=" ", timespec="seconds")
+
+
+@functools.lru_cache(maxsize=8)
+def _log_level(name: str) -> int:
+    """
+    ログレベル名を logging のレベル値に変換（レベル名ごとに結果をキャッシュする）
+
+    Args:
+        name: ログレベル名（例: "INFO"）
+
+    Returns:
+        int: ログレベル値
+    """
+    return getattr(logging, name)
+
+
+def _unwrap_id(value: Optional[Union[int, Dict[str, Any]]]) -> Optional[int]:
+    """
+    処理結果の辞書が渡された場合は、その article_id を取り出す
+
+    Args:
+        value: 記事ID、または article_id キーを持つ辞書
+
+    Returns:
+        Optional[int]: 記事ID（辞書に article_id がない場合は None）
+    """
+    return value.get("article_id") if isinstance(value, dict) else value
 
 
 class AppUI:
     """Gradioによるユーザーインターフェース"""
 
+    # トピック一覧・詳細のキャッシュの有効期限（秒）
+    TOPIC_CACHE_TTL = 10
+    # トピック選択のドロップダウンに表示する最大件数
+    TOPIC_CHOICES_LIMIT = 200
+
+    # 設定ファイルへの書き込みを遅らせる時間（秒）
+    SETTINGS_WRITE_DELAY = 0.5
+
+    # 全自動処理で、同じタイトル・説明のトピックの記事を再利用する期間（秒）
+    ARTICLE_REUSE_TTL = 24 * 60 * 60
+
+    # ステップ実行の各段（情報収集・記事作成・記事改善）で同時に処理するトピック数と待ち行列の長さ
+    STAGE_WORKERS = 4
+    STAGE_QUEUE_SIZE = 8
+
+    # Gradioのキュー設定
+    # 外部APIの応答待ちが大半を占める処理（情報収集・記事作成など）は、イベントごとに
+    # 同時実行数を設定して並行して処理する（Gradioの既定ではイベントごとに1件ずつ実行される）
+    SLOW_EVENT_CONCURRENCY = 4
+    # 待ち行列に入れられるリクエストの上限（超えた場合はすぐにエラーを返す）
+    QUEUE_MAX_SIZE = 32
+
     def __init__(self, app_service: AppService):
         """
         UIの初期化
@@ -23,6 +107,7 @@ class AppUI:
         """
         self.app_service = app_service
         self.setup_logging()
+        self.app_service.prepare_pool()
 
         # ステップ実行の状態管理
         self.current_topic_id = None
@@ -30,14 +115,36 @@ class AppUI:
         self.current_article_id = None
         self.current_improved_article_id = None
 
-        # 設定ファイルパス
-        self.settings_file = "app_settings.json"
+        # 設定ファイルへの書き込み（バックグラウンドで行い、連続した保存はまとめる）
+        self._settings_dirty = False
+        self._settings_write_task: Optional[asyncio.Task] = None
+
+        # ドロップダウンの更新やトピック選択のたびにDBを検索しないようキャッシュする
+        # （このUIからトピック・記事を更新した場合は該当するキャッシュを破棄する）
+        self._topics_cache = TTLCache(maxsize=1, ttl=self.TOPIC_CACHE_TTL)
+        self._topic_details_cache = TTLCache(maxsize=256, ttl=self.TOPIC_CACHE_TTL)
+
+        # ドロップダウンの選択肢（初回のみDBから取得し、以降はトピック作成時に先頭へ追加する）
+        self._topic_choices: Optional[List[Tuple[str, int]]] = None
+
+        # トピックごとの最新の記事ID（改善・投稿の対象を決めるたびにDBを検索しない）
+        self._latest_article_by_topic: Dict[int, int] = {}
+
+        # ステップ実行の各段を独立したワーカーで処理し、複数トピックの処理を重ねる
+        # （各段の同時実行数はキューで制限する）
+        self._news_stage = WorkerStage(self.STAGE_WORKERS, self.STAGE_QUEUE_SIZE)
+        self._article_stage = WorkerStage(self.STAGE_WORKERS, self.STAGE_QUEUE_SIZE)
+        self._improve_stage = WorkerStage(self.STAGE_WORKERS, self.STAGE_QUEUE_SIZE)
+
         self.load_settings()
 
     def setup_logging(self):
-        """ログ設定"""
+        """ログ設定（main.py などで設定済みの場合は何もしない）"""
+        if logging.getLogger().hasHandlers():
+            return
+
         logging.basicConfig(
-            level=getattr(logging, Config.LOG_LEVEL),
+            level=_log_level(Config.LOG_LEVEL),
             format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
             handlers=[logging.StreamHandler(), logging.FileHandler("app.log")],
         )
@@ -50,29 +157,25 @@ class AppUI:
             Dict: 設定情報
         """
         default_settings = {
-            "OPENAI_API_KEY": Config.OPENAI_API_KEY or "",
-            "NOTE_EMAIL": Config.NOTE_EMAIL or "",
-            "NOTE_PASSWORD": Config.NOTE_PASSWORD or "",
-            "DB_PATH": Config.DB_PATH or "news_reports.db",
-            "LOG_LEVEL": Config.LOG_LEVEL or "INFO",
+            key: getattr(Config, key) or default
+            for key, default in _SETTINGS_DEFAULTS.items()
         }
 
-        if os.path.exists(self.settings_file):
-            try:
-                with open(self.settings_file, "r", encoding="utf-8") as f:
-                    saved_settings = json.load(f)
-                    # デフォルト設定をアップデート
-                    default_settings.update(saved_settings)
-            except Exception as e:
-                logging.error(f"設定ファイル読み込み中にエラーが発生しました: {str(e)}")
+        try:
+            # デフォルト設定をアップデート
+            default_settings.update(Config.load_from_file())
+        except Exception as e:
+            logger.error("設定ファイル読み込み中にエラーが発生しました: %s", e)
 
         self.settings = default_settings
         return self.settings
 
-    def save_settings(self, settings: Dict[str, str]) -> Dict[str, Any]:
+    async def save_settings(self, settings: Dict[str, str]) -> Dict[str, Any]:
         """
         設定を保存する
 
+        設定値はすぐに反映し、設定ファイルへの書き込みはバックグラウンドで行う。
+
         Args:
             settings: 保存する設定
 
@@ -80,39 +183,63 @@ class AppUI:
             Dict: 処理結果
         """
         try:
-            # 設定を更新
-            self.settings.update(settings)
-
-            # 設定ファイルに保存
-            with open(self.settings_file, "w", encoding="utf-8") as f:
-                json.dump(self.settings, f, ensure_ascii=False, indent=2)
-
-            # 環境変数を更新（現在のプロセスのみ）
-            os.environ["OPENAI_API_KEY"] = settings.get("OPENAI_API_KEY", "")
-            os.environ["NOTE_EMAIL"] = settings.get("NOTE_EMAIL", "")
-            os.environ["NOTE_PASSWORD"] = settings.get("NOTE_PASSWORD", "")
-            os.environ["DB_PATH"] = settings.get("DB_PATH", "news_reports.db")
-            os.environ["LOG_LEVEL"] = settings.get("LOG_LEVEL", "INFO")
-
-            # Configクラスの値も更新
-            Config.OPENAI_API_KEY = settings.get("OPENAI_API_KEY", "")
-            Config.NOTE_EMAIL = settings.get("NOTE_EMAIL", "")
-            Config.NOTE_PASSWORD = settings.get("NOTE_PASSWORD", "")
-            Config.DB_PATH = settings.get("DB_PATH", "news_reports.db")
-            Config.LOG_LEVEL = settings.get("LOG_LEVEL", "INFO")
+            # 設定を更新（未指定の項目はデフォルト値にする）
+            updates = {
+                key: settings.get(key, default)
+                for key, default in _SETTINGS_DEFAULTS.items()
+            }
+            self.settings.update(updates)
+
+            # 設定ファイルに保存（書き込み中の場合は、終わった後に最新の設定をまとめて書き込む）
+            self._settings_dirty = True
+            if self._settings_write_task is None or self._settings_write_task.done():
+                self._settings_write_task = asyncio.create_task(self._write_settings())
+
+            # Configクラスの値と環境変数を更新（現在のプロセスのみ、変更された項目だけ）
+            changed = {
+                key: value
+                for key, value in updates.items()
+                if getattr(Config, key) != value
+            }
+            if changed:
+                Config.update(**changed)
 
             return {
                 "success": True,
                 "message": "設定を保存しました。新しい設定を適用するには、アプリケーションを再起動してください。",
             }
         except Exception as e:
-            logging.error(f"設定保存中にエラーが発生しました: {str(e)}", exc_info=True)
+            logger.error("設定保存中にエラーが発生しました: %s", e, exc_info=True)
             return {
                 "success": False,
                 "message": f"設定保存中にエラーが発生しました: {str(e)}",
             }
 
-    def create_topic(self, title: str, description: str) -> Dict[str, Any]:
+    async def _write_settings(self) -> None:
+        """未保存の設定を設定ファイルに書き込む（書き込み中に更新された場合は再度書き込む）"""
+        # 続けて保存された場合に1回の書き込みにまとめられるよう、少し待ってから書き込む
+        await asyncio.sleep(self.SETTINGS_WRITE_DELAY)
+        while self._settings_dirty:
+            self._settings_dirty = False
+            try:
+                await asyncio.to_thread(Config.save_to_file, dict(self.settings))
+            except Exception as e:
+                logger.error(
+                    "設定ファイル書き込み中にエラーが発生しました: %s", e, exc_info=True
+                )
+
+    def _invalidate_topic_cache(self, topic_id: Optional[int] = None) -> None:
+        """
+        トピック一覧と、指定したトピックの詳細のキャッシュを破棄
+
+        Args:
+            topic_id: 詳細のキャッシュを破棄するトピックID（Noneの場合は一覧のみ）
+        """
+        self._topics_cache.clear()
+        if topic_id is not None:
+            self._topic_details_cache.delete(int(topic_id))
+
+    async def create_topic(self, title: str, description: str) -> Dict[str, Any]:
         """
         トピックを作成するUIハンドラ
 
@@ -130,7 +257,12 @@ class AppUI:
                     "message": "トピックのタイトルを入力してください",
                 }
 
-            topic = self.app_service.create_topic(title, description)
+            # DBへの書き込みでイベントループを止めないよう別スレッドで実行
+            topic = await self.app_service.db_manager.run(
+                self.app_service.create_topic, title, description
+            )
+            self._invalidate_topic_cache()
+            self._add_topic_choice(topic.id, topic.title)
             # 現在のトピックIDを保存
             self.current_topic_id = topic.id
 
@@ -140,8 +272,11 @@ class AppUI:
                 "topic_id": topic.id,
             }
         except Exception as e:
-            logging.error(
-                f"トピック作成中にエラーが発生しました: {str(e)}", exc_info=True
+            # 想定された失敗（ValueError）はトレースバックを出力しない
+            logger.error(
+                "トピック作成中にエラーが発生しました: %s",
+                e,
+                exc_info=not isinstance(e, ValueError),
             )
             return {"success": False, "message": f"エラー: {str(e)}"}
 
@@ -152,23 +287,62 @@ class AppUI:
         Returns:
             List[Dict]: トピックリスト
         """
+        cached = self._topics_cache.get("topics")
+        if cached is not None:
+            return cached
+
         try:
             topics = self.app_service.get_topics()
-            return [
+            result = [
                 {
                     "id": topic.id,
                     "title": topic.title,
                     "description": topic.description or "",
-                    "created_at": topic.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+                    "created_at": _format_datetime(topic.created_at),
                 }
                 for topic in topics
             ]
+            self._topics_cache.set("topics", result)
+            return result
         except Exception as e:
-            logging.error(
-                f"トピック取得中にエラーが発生しました: {str(e)}", exc_info=True
-            )
+            logger.error("トピック取得中にエラーが発生しました: %s", e, exc_info=True)
             return []
 
+    def get_topic_choices(self) -> List[Tuple[str, int]]:
+        """
+        トピック選択のドロップダウンの選択肢を取得するUIハンドラ
+
+        Returns:
+            List[Tuple[str, int]]: (表示名, トピックID) のリスト
+        """
+        if self._topic_choices is not None:
+            return self._topic_choices
+
+        try:
+            self._topic_choices = [
+                (f"{topic_id}: {title}", topic_id)
+                for topic_id, title in self.app_service.get_topic_choices(
+                    self.TOPIC_CHOICES_LIMIT
+                )
+            ]
+            return self._topic_choices
+        except Exception as e:
+            logger.error("トピック取得中にエラーが発生しました: %s", e, exc_info=True)
+            return []
+
+    def _add_topic_choice(self, topic_id: int, title: str) -> None:
+        """
+        作成したトピックをドロップダウンの選択肢の先頭に追加（未取得の場合は何もしない）
+
+        Args:
+            topic_id: トピックID
+            title: トピックのタイトル
+        """
+        if self._topic_choices is None:
+            return
+        self._topic_choices.insert(0, (f"{topic_id}: {title}", topic_id))
+        del self._topic_choices[self.TOPIC_CHOICES_LIMIT :]
+
     async def collect_news(self, topic_id: Optional[int] = None) -> Dict[str, Any]:
         """
         ニュース収集UIハンドラ
@@ -187,8 +361,11 @@ class AppUI:
             if not topic_id:
                 return {"success": False, "message": "トピックを選択してください"}
 
-            # ここで await を追加して非同期処理の完了を待つ
-            news_data = await self.app_service.collect_news_for_topic(int(topic_id))
+            # 情報収集の段のワーカーで実行し、完了を待つ
+            news_data = await self._news_stage.run(
+                self.app_service.collect_news_for_topic, int(topic_id)
+            )
+            self._invalidate_topic_cache(topic_id)
 
             # 現在のニュースIDを保存
             self.current_news_id = news_data.id
@@ -202,17 +379,31 @@ class AppUI:
                 "topic_id": topic_id,
             }
         except Exception as e:
-            logging.error(
-                f"ニュース収集中にエラーが発生しました: {str(e)}", exc_info=True
+            logger.error(
+                "ニュース収集中にエラーが発生しました: %s",
+                e,
+                exc_info=not isinstance(e, ValueError),
             )
             return {"success": False, "message": f"エラー: {str(e)}"}
 
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def format_status(success: bool, message: str) -> str:
+        """
+        処理結果のメッセージを表示用にフォーマット（副作用のない関数としてキャッシュする）
+
+        Args:
+            success: 処理が成功したかどうか
+            message: 結果メッセージ
+
+        Returns:
+            str: 表示用のメッセージ
+        """
+        return (_STATUS_OK if success else _STATUS_FAIL) + message
+
     def format_topic_status(self, result):
         """トピック作成結果をフォーマット"""
-        if result.get("success"):
-            return f"✅ {result['message']}"
-        else:
-            return f"❌ {result['message']}"
+        return self.format_status(bool(result.get("success")), result["message"])
 
     async def collect_news_with_progress(self, topic_id):
         """
@@ -245,11 +436,15 @@ class AppUI:
             if not topic_id:
                 return {"success": False, "message": "トピックを選択してください"}
 
-            # await を追加して非同期処理の完了を待つ
-            article = await self.app_service.create_article_for_topic(int(topic_id))
+            # 記事作成の段のワーカーで実行し、完了を待つ
+            article = await self._article_stage.run(
+                self.app_service.create_article_for_topic, int(topic_id)
+            )
+            self._invalidate_topic_cache(topic_id)
 
-            # 現在の記事IDを保存
+            # 現在の記事IDを保存（トピックの最新の記事IDも更新）
             self.current_article_id = article.id
+            self._latest_article_by_topic[int(topic_id)] = article.id
             # トピックIDも更新
             self.current_topic_id = int(topic_id)
 
@@ -261,9 +456,53 @@ class AppUI:
                 "topic_id": topic_id,
             }
         except Exception as e:
-            logging.error(f"記事作成中にエラーが発生しました: {str(e)}", exc_info=True)
+            logger.error(
+                "記事作成中にエラーが発生しました: %s",
+                e,
+                exc_info=not isinstance(e, ValueError),
+            )
             return {"success": False, "message": f"エラー: {str(e)}"}
 
+    async def _resolve_article_id(
+        self,
+        article_id: Optional[Union[int, Dict[str, Any]]],
+        topic_id: Optional[int],
+    ) -> Tuple[Optional[int], Optional[str]]:
+        """
+        処理対象の記事IDを決定（指定がない場合はトピックの最新の記事）
+
+        Args:
+            article_id: 記事ID（Noneの場合はトピックから記事を取得）
+            topic_id: トピックID（Noneの場合は現在のトピックIDを使用）
+
+        Returns:
+            Tuple[Optional[int], Optional[str]]: (記事ID, エラーメッセージ)
+        """
+        # 記事IDが指定されていない場合はトピックから取得
+        if article_id is None:
+            if topic_id is None:
+                topic_id = self.current_topic_id
+
+            if not topic_id:
+                return None, "トピックまたは記事を選択してください"
+
+            # トピックに関連する最新の記事IDを取得（記事作成までは同じIDを使う）
+            topic_id = int(topic_id)
+            article_id = self._latest_article_by_topic.get(topic_id)
+            if article_id is None:
+                article_id = await self.app_service.db_manager.run(
+                    self.app_service.article_repo.get_latest_id_by_topic_id, topic_id
+                )
+                if article_id is None:
+                    return None, f"トピックID {topic_id} に関連する記事が見つかりません"
+                self._latest_article_by_topic[topic_id] = article_id
+
+        actual_id = _unwrap_id(article_id)
+        if not actual_id:
+            return None, "記事を選択してください"
+
+        return int(actual_id), None
+
     async def improve_article(
         self,
         article_id: Optional[Union[int, Dict[str, Any]]] = None,
@@ -280,37 +519,15 @@ class AppUI:
             Dict: 処理結果
         """
         try:
-            # 記事IDが指定されていない場合はトピックから取得
-            if article_id is None:
-                if topic_id is None:
-                    topic_id = self.current_topic_id
-
-                if not topic_id:
-                    return {
-                        "success": False,
-                        "message": "トピックまたは記事を選択してください",
-                    }
-
-                # トピックに関連する最新の記事を取得
-                articles = self.app_service.article_repo.get_by_topic_id(int(topic_id))
-                if not articles:
-                    return {
-                        "success": False,
-                        "message": f"トピックID {topic_id} に関連する記事が見つかりません",
-                    }
-                article_id = articles[0].id
-
-            # article_id が辞書の場合は、idキーからIDを取得
-            if isinstance(article_id, dict) and "article_id" in article_id:
-                actual_id = article_id["article_id"]
-            else:
-                actual_id = article_id
-
-            if not actual_id:
-                return {"success": False, "message": "記事を選択してください"}
+            actual_id, error = await self._resolve_article_id(article_id, topic_id)
+            if error:
+                return {"success": False, "message": error}
 
             # 型変換
-            improved_article = self.app_service.improve_article(int(actual_id))
+            improved_article = await self._improve_stage.run(
+                self.app_service.improve_article, int(actual_id)
+            )
+            self._invalidate_topic_cache(improved_article.topic_id)
             # 改善済み記事IDを保存
             self.current_improved_article_id = improved_article.id
             # 記事IDも更新
@@ -326,10 +543,14 @@ class AppUI:
                 "topic_id": improved_article.topic_id,
             }
         except Exception as e:
-            logging.error(f"記事改善中にエラーが発生しました: {str(e)}", exc_info=True)
+            logger.error(
+                "記事改善中にエラーが発生しました: %s",
+                e,
+                exc_info=not isinstance(e, ValueError),
+            )
             return {"success": False, "message": f"エラー: {str(e)}"}
 
-    def post_to_note(
+    async def post_to_note(
         self,
         article_id: Optional[Union[int, Dict[str, Any]]] = None,
         topic_id: Optional[int] = None,
@@ -345,46 +566,27 @@ class AppUI:
             Dict: 処理結果
         """
         try:
-            # 記事IDが指定されていない場合はトピックから取得
-            if article_id is None:
-                if topic_id is None:
-                    topic_id = self.current_topic_id
-
-                if not topic_id:
-                    return {
-                        "success": False,
-                        "message": "トピックまたは記事を選択してください",
-                    }
-
-                # トピックに関連する最新の記事を取得
-                articles = self.app_service.article_repo.get_by_topic_id(int(topic_id))
-                if not articles:
-                    return {
-                        "success": False,
-                        "message": f"トピックID {topic_id} に関連する記事が見つかりません",
-                    }
-                article_id = articles[0].id
-
-            # article_id が辞書の場合は、idキーからIDを取得
-            if isinstance(article_id, dict) and "article_id" in article_id:
-                actual_id = article_id["article_id"]
-            else:
-                actual_id = article_id
-
-            if not actual_id:
-                return {"success": False, "message": "記事を選択してください"}
+            actual_id, error = await self._resolve_article_id(article_id, topic_id)
+            if error:
+                return {"success": False, "message": error}
 
             # Noteの認証情報確認
-            if not Config.NOTE_EMAIL or not Config.NOTE_PASSWORD:
+            if not Config.has_note_credentials:
                 return {
                     "success": False,
                     "message": "Note投稿には認証情報の設定が必要です。設定タブから設定してください。",
                 }
 
-            success = self.app_service.post_article_to_note(int(actual_id))
+            # 投稿はNoteとの通信で時間がかかるため、イベントループを止めないよう別スレッドで実行
+            success = await asyncio.to_thread(
+                self.app_service.post_article_to_note, int(actual_id)
+            )
             if success:
                 # 記事の情報を取得して返す
-                article = self.app_service.article_repo.get_by_id(int(actual_id))
+                article = await self.app_service.db_manager.run(
+                    self.app_service.article_repo.get_by_id, int(actual_id)
+                )
+                self._invalidate_topic_cache(article.topic_id)
                 return {
                     "success": True,
                     "message": f"記事「{article.title}」をNoteに投稿しました",
@@ -394,11 +596,19 @@ class AppUI:
             else:
                 return {"success": False, "message": "Noteへの投稿に失敗しました"}
         except Exception as e:
-            logging.error(f"Note投稿中にエラーが発生しました: {str(e)}", exc_info=True)
+            logger.error(
+                "Note投稿中にエラーが発生しました: %s",
+                e,
+                exc_info=not isinstance(e, ValueError),
+            )
             return {"success": False, "message": f"エラー: {str(e)}"}
 
-    def run_full_process(
-        self, title: str, description: str, post_to_note: bool
+    async def run_full_process(
+        self,
+        title: str,
+        description: str,
+        post_to_note: bool,
+        on_message: Optional[Callable[[str], None]] = None,
     ) -> Dict[str, Any]:
         """
         全プロセス実行UIハンドラ
@@ -407,6 +617,7 @@ class AppUI:
             title: トピックのタイトル
             description: トピックの説明
             post_to_note: Noteに投稿するかどうか
+            on_message: 各ステップの進捗メッセージを受け取るコールバック
 
         Returns:
             Dict: プロセスの結果情報
@@ -418,7 +629,33 @@ class AppUI:
                     "message": "トピックのタイトルを入力してください",
                 }
 
-            result = self.app_service.run_full_process(title, description, post_to_note)
+            # Noteに投稿しない場合は、同じトピックで最近作成した記事があれば再利用する
+            if not post_to_note:
+                article = await self.app_service.db_manager.run(
+                    self.app_service.find_recent_article,
+                    title,
+                    description,
+                    self.ARTICLE_REUSE_TTL,
+                )
+                if article:
+                    self.current_topic_id = article.topic_id
+                    self.current_article_id = article.id
+                    if article.improved_content:
+                        self.current_improved_article_id = article.id
+                    return {
+                        "success": True,
+                        "message": f"同じトピックで作成済みの記事「{article.title}」を再利用しました"
+                        f"（作成日時: {_format_datetime(article.created_at)}）",
+                        "article_content": article.improved_content or article.content,
+                    }
+
+            result = await self.app_service.run_full_process(
+                title, description, post_to_note, on_message=on_message
+            )
+            # 新しいトピックが作成されるため一覧のキャッシュを破棄する
+            self._invalidate_topic_cache()
+            if result.get("topic"):
+                self._add_topic_choice(result["topic"].id, result["topic"].title)
 
             # 結果のフォーマット
             article = result.get("improved_article") or result.get("article")
@@ -442,8 +679,10 @@ class AppUI:
                 "article_content": content,
             }
         except Exception as e:
-            logging.error(
-                f"全プロセス実行中にエラーが発生しました: {str(e)}", exc_info=True
+            logger.error(
+                "全プロセス実行中にエラーが発生しました: %s",
+                e,
+                exc_info=not isinstance(e, ValueError),
             )
             return {"success": False, "message": f"エラー: {str(e)}"}
 
@@ -476,7 +715,7 @@ class AppUI:
         try:
             return self.app_service.article_repo.get_by_id(article_id)
         except Exception as e:
-            logging.error(f"記事取得中にエラーが発生しました: {str(e)}", exc_info=True)
+            logger.error("記事取得中にエラーが発生しました: %s", e, exc_info=True)
             return None
 
     def get_topic_details(self, topic_id: int) -> Dict[str, Any]:
@@ -489,47 +728,66 @@ class AppUI:
         Returns:
             Dict: トピック情報
         """
+        cached = self._topic_details_cache.get(int(topic_id))
+        if cached is not None:
+            return cached
+
         try:
-            topic = self.app_service.topic_repo.get_by_id(topic_id)
-            if not topic:
+            # トピック・関連する記事・ニュースデータの有無を1回の問い合わせで取得
+            topic_details = self.app_service.get_topic_details(int(topic_id))
+            if not topic_details:
                 return {
                     "success": False,
                     "message": f"トピックID {topic_id} が見つかりません",
                 }
 
-            # トピックに関連する記事を取得
-            articles = self.app_service.article_repo.get_by_topic_id(topic_id)
-
-            # ニュースデータを取得
-            news_data = self.app_service.news_repo.get_by_topic_id(topic_id)
+            topic = topic_details.topic
 
-            return {
+            details = {
                 "success": True,
                 "topic": {
                     "id": topic.id,
                     "title": topic.title,
                     "description": topic.description,
-                    "created_at": topic.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+                    "created_at": _format_datetime(topic.created_at),
                 },
-                "has_news": news_data is not None,
+                "has_news": topic_details.has_news,
                 "articles": [
                     {
                         "id": article.id,
                         "title": article.title,
                         "status": article.status,
-                        "created_at": article.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+                        "created_at": _format_datetime(article.created_at),
                     }
-                    for article in articles
+                    for article in topic_details.articles
                 ],
             }
+            self._topic_details_cache.set(int(topic_id), details)
+            return details
         except Exception as e:
-            logging.error(
-                f"トピック詳細取得中にエラーが発生しました: {str(e)}", exc_info=True
+            logger.error(
+                "トピック詳細取得中にエラーが発生しました: %s", e, exc_info=True
             )
             return {"success": False, "message": f"エラー: {str(e)}"}
 
     def launch(self):
         """UIを起動"""
+        # gradio は読み込みが重いため、UIを起動するときまで読み込まない
+        import gradio as gr
+
+        # イベントハンドラから呼ぶメソッドは、呼び出しのたびに self から参照しないよう先に束縛しておく
+        run_full_process = self.run_full_process
+        create_topic = self.create_topic
+        get_topic_choices = self.get_topic_choices
+        get_topic_details = self.get_topic_details
+        create_article = self.create_article
+        improve_article = self.improve_article
+        post_to_note = self.post_to_note
+        save_settings = self.save_settings
+        format_topic_status = self.format_topic_status
+        # 出力を変更しない場合に返す更新（共通のものを使い回す）
+        unchanged = gr.update()
+
         with gr.Blocks(title="ニュース記事自動生成システム") as app:
             # 状態変数
             current_article_content = gr.State(value="")
@@ -740,12 +998,37 @@ class AppUI:
                 article_content = result.get("article_content", "")
                 return message, article_content
 
+            async def run_full_process_handler(title, desc, post):
+                """全プロセスを実行し、各ステップが終わるたびに進捗を表示する"""
+                progress: asyncio.Queue = asyncio.Queue()
+                task = asyncio.ensure_future(
+                    run_full_process(title, desc, post, on_message=progress.put_nowait)
+                )
+                lines: List[str] = []
+                try:
+                    yield "⏳ 処理を開始しました", ""
+                    while not task.done():
+                        getter = asyncio.ensure_future(progress.get())
+                        await asyncio.wait(
+                            {task, getter}, return_when=asyncio.FIRST_COMPLETED
+                        )
+                        if getter.done():
+                            lines.append(getter.result())
+                            # 記事の表示は開始時に消去済みのため、完了まで送り直さない
+                            yield "\n".join(lines) + "\n⏳ 処理中...", unchanged
+                        else:
+                            getter.cancel()
+                    yield format_full_process_result(task.result())
+                finally:
+                    # 画面を閉じるなどで中断された場合は処理も取り消す
+                    if not task.done():
+                        task.cancel()
+
             run_btn.click(
-                fn=lambda title, desc, post: format_full_process_result(
-                    self.run_full_process(title, desc, post)
-                ),
+                fn=run_full_process_handler,
                 inputs=[title_input, desc_input, note_post_checkbox],
                 outputs=[status_output, article_output],
+                concurrency_limit=self.SLOW_EVENT_CONCURRENCY,
             )
 
             clear_btn.click(
@@ -760,10 +1043,13 @@ class AppUI:
                 if not topic_id:
                     return "", None
 
-                result = self.get_topic_details(topic_id)
+                result = get_topic_details(topic_id)
                 if not result.get("success"):
                     return (
-                        f"❌ {result.get('message', 'トピック情報の取得に失敗しました')}",
+                        self.format_status(
+                            False,
+                            result.get("message", "トピック情報の取得に失敗しました"),
+                        ),
                         None,
                     )
 
@@ -771,40 +1057,37 @@ class AppUI:
                 articles = result.get("articles", [])
                 has_news = result.get("has_news", False)
 
-                info = f"**トピック**: {topic['title']}\n\n"
+                parts = [f"**トピック**: {topic['title']}\n\n"]
                 if topic["description"]:
-                    info += f"**説明**: {topic['description']}\n\n"
-                info += f"**作成日時**: {topic['created_at']}\n\n"
+                    parts.append(f"**説明**: {topic['description']}\n\n")
+                parts.append(f"**作成日時**: {topic['created_at']}\n\n")
 
-                info += f"**ニュースデータ**: {'あり' if has_news else 'なし'}\n\n"
+                parts.append(
+                    f"**ニュースデータ**: {'あり' if has_news else 'なし'}\n\n"
+                )
 
                 if articles:
-                    info += "**関連記事**:\n"
+                    parts.append("**関連記事**:\n")
                     for article in articles:
-                        status_emoji = (
-                            "📝"
-                            if article["status"] == "draft"
-                            else "✨"
-                            if article["status"] == "improved"
-                            else "🌐"
-                            if article["status"] == "published"
-                            else "❓"
+                        status_emoji = _STATUS_EMOJI.get(article["status"], "❓")
+                        parts.append(
+                            f"- {status_emoji} {article['title']} ({article['status']})\n"
                         )
-                        info += f"- {status_emoji} {article['title']} ({article['status']})\n"
                 else:
-                    info += "**関連記事**: なし\n"
+                    parts.append("**関連記事**: なし\n")
 
                 # 現在のトピックIDを更新
                 self.current_topic_id = topic_id
 
-                return info, topic_id
+                return "".join(parts), topic_id
 
             # トピック作成
+            async def create_topic_handler(title, desc):
+                result = await create_topic(title, desc)
+                return format_topic_status(result), self.current_topic_id
+
             create_topic_btn.click(
-                fn=lambda title, desc: (
-                    self.format_topic_status(self.create_topic(title, desc)),
-                    self.current_topic_id,
-                ),
+                fn=create_topic_handler,
                 inputs=[step_title_input, step_desc_input],
                 outputs=[topic_status, current_topic_id],
             )
@@ -818,10 +1101,7 @@ class AppUI:
 
             # トピックリスト更新
             def update_topics_dropdown():
-                topics = self.get_topics()
-                return gr.update(
-                    choices=[(f"{t['id']}: {t['title']}", t["id"]) for t in topics]
-                )
+                return gr.update(choices=get_topic_choices())
 
             refresh_topics_btn.click(fn=update_topics_dropdown, outputs=topic_dropdown)
 
@@ -830,54 +1110,64 @@ class AppUI:
                 fn=self.collect_news_with_progress,
                 inputs=current_topic_id,
                 outputs=news_status,
+                concurrency_limit=self.SLOW_EVENT_CONCURRENCY,
             )
 
             # 記事作成
-            async def create_article_with_progress(topic_id):
+            def render_if_changed(content, rendered):
+                """表示中の記事と同じ内容の場合は Markdown を送り直さない"""
+                if content == rendered:
+                    return unchanged, rendered
+                return content, content
+
+            async def create_article_with_progress(topic_id, rendered):
                 """
                 記事作成関数（プログレスバー付き）
                 """
-                result = await self.create_article(topic_id)
-                message = self.format_topic_status(result)
+                result = await create_article(topic_id)
+                message = format_topic_status(result)
                 content = (
                     result.get("article_content", "") if result.get("success") else ""
                 )
-                return message, content
+                return message, *render_if_changed(content, rendered)
 
             create_article_btn.click(
                 fn=create_article_with_progress,
-                inputs=current_topic_id,
-                outputs=[article_status, step_article_output],
+                inputs=[current_topic_id, current_article_content],
+                outputs=[article_status, step_article_output, current_article_content],
+                concurrency_limit=self.SLOW_EVENT_CONCURRENCY,
             )
 
             # 記事改善
-            async def improve_article_with_topic(topic_id):
-                result = await self.improve_article(topic_id=topic_id)
-                message = self.format_topic_status(result)
+            async def improve_article_with_topic(topic_id, rendered):
+                result = await improve_article(topic_id=topic_id)
+                message = format_topic_status(result)
                 content = (
                     result.get("improved_content", "") if result.get("success") else ""
                 )
-                return message, content
+                return message, *render_if_changed(content, rendered)
 
             improve_article_btn.click(
                 fn=improve_article_with_topic,
-                inputs=current_topic_id,
-                outputs=[improve_status, step_article_output],
+                inputs=[current_topic_id, current_article_content],
+                outputs=[improve_status, step_article_output, current_article_content],
+                concurrency_limit=self.SLOW_EVENT_CONCURRENCY,
             )
 
             # Note投稿
-            def post_to_note_with_topic(topic_id):
-                result = self.post_to_note(topic_id=topic_id)
-                return self.format_topic_status(result)
+            async def post_to_note_with_topic(topic_id):
+                result = await post_to_note(topic_id=topic_id)
+                return format_topic_status(result)
 
             post_note_btn.click(
                 fn=post_to_note_with_topic,
                 inputs=current_topic_id,
                 outputs=post_status,
+                concurrency_limit=self.SLOW_EVENT_CONCURRENCY,
             )
 
             # 設定保存
-            def save_settings_handler(api_key, email, password, db, log_level):
+            async def save_settings_handler(api_key, email, password, db, log_level):
                 settings = {
                     "OPENAI_API_KEY": api_key,
                     "NOTE_EMAIL": email,
@@ -885,11 +1175,7 @@ class AppUI:
                     "DB_PATH": db,
                     "LOG_LEVEL": log_level,
                 }
-                result = self.save_settings(settings)
-                if result.get("success"):
-                    return f"✅ {result['message']}"
-                else:
-                    return f"❌ {result['message']}"
+                return format_topic_status(await save_settings(settings))
 
             save_settings_btn.click(
                 fn=save_settings_handler,
@@ -900,5 +1186,18 @@ class AppUI:
             # 初期化時にトピック一覧を更新
             app.load(fn=update_topics_dropdown, outputs=topic_dropdown)
 
+        # 時間のかかる処理は上記のイベントごとの同時実行数で並行させ、
+        # トピック一覧の更新などの軽い処理はそれらに待たされないよう制限しない
+        app.queue(default_concurrency_limit=None, max_size=self.QUEUE_MAX_SIZE)
+
+        # uvloop がある環境では、非同期ハンドラを動かすイベントループを uvloop にする
+        # （Windows など uvloop が無い環境では標準のイベントループを使用）
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
         # Gradioアプリを起動
         app.launch(share=False)
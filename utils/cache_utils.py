@@ -0,0 +1,78 @@
+# utils/cache_utils.py
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """有効期限付きのLRUキャッシュ（複数のスレッドから使用できる）"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 86400):
+        """
+        キャッシュの初期化
+
+        Args:
+            maxsize: 保持する最大件数（超えた場合は最も古く使われたものから削除）
+            ttl: 有効期限（秒）
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        # 取得と削除・並べ替えの間に別のスレッドが clear しても KeyError にならないようにする
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        キャッシュから値を取得
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            Optional[Any]: キャッシュされた値、または None（未登録・期限切れ）
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        キャッシュに値を登録
+
+        Args:
+            key: キャッシュキー
+            value: 登録する値
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """
+        キャッシュから値を削除（未登録の場合は何もしない）
+
+        Args:
+            key: キャッシュキー
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """キャッシュを空にする"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
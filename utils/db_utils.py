@@ -1,14 +1,182 @@
 # utils/db_utils.py
+import asyncio
+import atexit
+import contextvars
+import functools
 import logging
 import sqlite3
-from typing import TypeVar
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, List, Optional, TypeVar
 
 T = TypeVar("T")
 
+# スキーマのバージョン（PRAGMA user_version に保存）
+# 1: 日時カラムをUNIXエポック秒（INTEGER）で保存
+# 2: articles.news_data_id のインデックスを追加
+# 3: STRICT テーブルに変更し、AUTOINCREMENT を廃止
+# 4: 記事の全文検索インデックス（articles_fts）を追加
+# 5: news_data.sources に JSON の検査制約を追加
+SCHEMA_VERSION = 5
+
+# 日時を保存するカラム
+_TIMESTAMP_COLUMNS = ("created_at", "updated_at", "published_at")
+
+# STRICT テーブル（列の型を強制し、型変換の判定を省く）は SQLite 3.37.0 以降のみ対応
+_TABLE_OPTIONS = " STRICT" if sqlite3.sqlite_version_info >= (3, 37, 0) else ""
+
+# テーブル定義（親テーブルから順に作成する）
+# id は AUTOINCREMENT を付けない（sqlite_sequence の更新を挿入ごとに行わないため）
+_TABLE_DDL = {
+    # トピックテーブル
+    "topics": f"""
+        CREATE TABLE IF NOT EXISTS topics (
+            id INTEGER PRIMARY KEY,
+            title TEXT NOT NULL,
+            description TEXT,
+            created_at INTEGER NOT NULL,
+            updated_at INTEGER NOT NULL
+        ){_TABLE_OPTIONS}
+        """,
+    # ニュースデータテーブル
+    "news_data": f"""
+        CREATE TABLE IF NOT EXISTS news_data (
+            id INTEGER PRIMARY KEY,
+            topic_id INTEGER NOT NULL,
+            sources TEXT NOT NULL CHECK (json_valid(sources)),
+            created_at INTEGER NOT NULL,
+            FOREIGN KEY (topic_id) REFERENCES topics (id)
+        ){_TABLE_OPTIONS}
+        """,
+    # 記事テーブル
+    "articles": f"""
+        CREATE TABLE IF NOT EXISTS articles (
+            id INTEGER PRIMARY KEY,
+            topic_id INTEGER NOT NULL,
+            news_data_id INTEGER,
+            title TEXT NOT NULL,
+            content TEXT NOT NULL,
+            improved_content TEXT,
+            status TEXT NOT NULL,
+            created_at INTEGER NOT NULL,
+            updated_at INTEGER NOT NULL,
+            published_at INTEGER,
+            FOREIGN KEY (topic_id) REFERENCES topics (id),
+            FOREIGN KEY (news_data_id) REFERENCES news_data (id)
+        ){_TABLE_OPTIONS}
+        """,
+}
+
+# インデックス定義
+# idx_*_topic_created: トピックごとの最新行を並べ替えなしで取得するため
+# （topic_id 単独の検索・外部キーの検査にも使われる）
+# idx_articles_news_data: ニュースデータの削除時に参照する記事を探す外部キーの検査用
+_INDEX_DDL = (
+    "CREATE INDEX IF NOT EXISTS idx_news_topic_created ON news_data (topic_id, created_at DESC, id DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_articles_topic_created ON articles (topic_id, created_at DESC, id DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_articles_news_data ON articles (news_data_id)",
+)
+
+# 記事の全文検索インデックス（本文は articles から参照し、トリガーで同期する）
+# 日本語は単語を空白で区切らないため、3文字単位で索引する trigram を使う（SQLite 3.34.0 以降）
+_FTS_TOKENIZER = "trigram" if sqlite3.sqlite_version_info >= (3, 34, 0) else "unicode61"
+_FTS_COLUMNS = "title, content, improved_content"
+_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5("
+    f"{_FTS_COLUMNS}, content='articles', content_rowid='id', tokenize='{_FTS_TOKENIZER}')",
+    f"""
+    CREATE TRIGGER IF NOT EXISTS articles_fts_ai AFTER INSERT ON articles BEGIN
+        INSERT INTO articles_fts (rowid, {_FTS_COLUMNS})
+        VALUES (new.id, new.title, new.content, new.improved_content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS articles_fts_ad AFTER DELETE ON articles BEGIN
+        INSERT INTO articles_fts (articles_fts, rowid, {_FTS_COLUMNS})
+        VALUES ('delete', old.id, old.title, old.content, old.improved_content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS articles_fts_au
+    AFTER UPDATE OF {_FTS_COLUMNS} ON articles BEGIN
+        INSERT INTO articles_fts (articles_fts, rowid, {_FTS_COLUMNS})
+        VALUES ('delete', old.id, old.title, old.content, old.improved_content);
+        INSERT INTO articles_fts (rowid, {_FTS_COLUMNS})
+        VALUES (new.id, new.title, new.content, new.improved_content);
+    END
+    """,
+)
+
+# スキーマ作成のスクリプト（1回の解析・1つのトランザクションで実行する）
+_SCHEMA_SCRIPT = (
+    "BEGIN IMMEDIATE;\n"
+    + ";\n".join(
+        [
+            *_TABLE_DDL.values(),
+            *_INDEX_DDL,
+            *_FTS_DDL,
+            f"PRAGMA user_version = {SCHEMA_VERSION}",
+        ]
+    )
+    + ";\nCOMMIT;"
+)
+
+
+# 接続ごとに適用する設定
+# synchronous=NORMAL: WAL ではコミットごとの fsync を省いてもデータベースは壊れない
+# （fsync はチェックポイント時のみ）
+# cache_size: ページキャッシュを約64MBに拡大（負の値はKB単位）
+# busy_timeout: 別の接続が書き込み中の場合、すぐにエラーにせず最大5秒待つ
+# journal_size_limit: チェックポイント後に残すWALファイルを最大64MBに制限
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA mmap_size = 10737418240;
+    PRAGMA cache_size = -65536;
+    PRAGMA busy_timeout = 5000;
+    PRAGMA foreign_keys = ON;
+    PRAGMA journal_size_limit = 67108864;
+"""
+
+# 接続ごとにキャッシュするプリペアドステートメントの数
+# （リポジトリの SQL はすべて ? で値を渡す定数のため、種類数はこの範囲に収まる）
+_STATEMENT_CACHE_SIZE = 256
+
+
+def last_insert_ids(cursor: sqlite3.Cursor, count: int) -> range:
+    """
+    直前の executemany で挿入された行のIDを取得
+
+    executemany は lastrowid を設定しないため、last_insert_rowid() から逆算する。
+    同一トランザクション内（書き込みロック保持中）で呼び出すこと。
+
+    Args:
+        cursor: executemany を実行したカーソル
+        count: 挿入した行数
+
+    Returns:
+        range: 挿入された行のID（挿入順）
+    """
+    last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+    return range(last_id - count + 1, last_id + 1)
+
 
 class DatabaseManager:
     """SQLiteデータベース管理クラス"""
 
+    # 定期メンテナンス（PRAGMA optimize・空きページの解放・WALのチェックポイント）の間隔（秒）
+    OPTIMIZE_INTERVAL = 15 * 60
+    # run() で使用するデータベース専用スレッドの数（スレッドごとに接続を持つ）
+    DB_WORKERS = 4
+    # 定期メンテナンスで解放する空きページの最大数
+    VACUUM_PAGES = 1000
+
+    # 同じデータベースの初期化（スキーマの確認・作成）をプロセス内で直列化するロック
+    _init_lock = threading.Lock()
+
     def __init__(self, db_path: str = "news_reports.db"):
         """
         データベース管理クラスの初期化
@@ -17,8 +185,25 @@ class DatabaseManager:
             db_path: データベースファイルのパス
         """
         self.db_path = db_path
-        self.conn = None
+        # スレッドごとに使い回す接続（run() の専用スレッドなど）
+        self._local = threading.local()
+        # 全スレッドの接続（終了時にまとめて閉じるため）
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        atexit.register(self.close_all)
+        # 書き込みトランザクションを同時に1つに制限するロック
+        # （複数のスレッドが同時に transaction() 内で書き込むことはない）
+        self._write_lock = threading.Lock()
+        self._optimize_timer: Optional[threading.Timer] = None
+        self._optimize_conn: Optional[sqlite3.Connection] = None
+        # close_all の後は接続を作成させない
+        self._closed = False
+        # 非同期処理からの操作を実行する専用スレッド（接続を持つスレッドを一定数に保つ）
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.DB_WORKERS, thread_name_prefix="db"
+        )
         self.initialize_database()
+        self._schedule_optimize()
 
     def get_connection(self) -> sqlite3.Connection:
         """
@@ -27,62 +212,391 @@ class DatabaseManager:
         Returns:
             sqlite3.Connection: データベース接続
         """
-        # スレッドセーフな接続を新規に作成
-        # check_same_thread=False で別スレッドからのアクセスを許可
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        conn.row_factory = sqlite3.Row
+        # 接続はスレッドごとに一度だけ作成し、以降は同じ接続を使い回す
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._closed:
+            self._check_open()
+            # リポジトリは列を明示して位置で参照するため row_factory は設定しない
+            conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                cached_statements=_STATEMENT_CACHE_SIZE,
+            )
+            self._configure_connection(conn)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _check_open(self) -> None:
+        """
+        close_all で閉じられていないかを確認
+
+        Raises:
+            sqlite3.ProgrammingError: close_all の後に呼ばれた場合
+        """
+        if self._closed:
+            raise sqlite3.ProgrammingError("データベース管理クラスは閉じられています")
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        データベース操作をデータベース専用スレッドで実行し、イベントループを止めずに結果を待つ
+
+        asyncio.to_thread と異なり既定のスレッドプールを使わないため、
+        接続を持つスレッドが DB_WORKERS 個に限られ、作成済みの接続が使い回される。
+
+        Args:
+            fn: 実行する関数（リポジトリのメソッドなど）
+            *args: fn に渡す引数
+
+        Returns:
+            T: fn の戻り値
+        """
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(ctx.run, fn, *args)
+        )
+
+    def get_readonly_connection(self) -> sqlite3.Connection:
+        """
+        読み込み専用のSQLite接続を取得（SELECT のみを行う処理で使用する）
+
+        書き込みロックを取得しないため、WAL では書き込み中も待たずに読み込める。
+        インメモリデータベースは接続ごとに別のデータベースになるため、get_connection の接続を返す。
+
+        Returns:
+            sqlite3.Connection: 読み込み専用のデータベース接続
+        """
+        if self.db_path == ":memory:":
+            return self.get_connection()
+
+        conn = getattr(self._local, "readonly_conn", None)
+        if conn is None or self._closed:
+            self._check_open()
+            conn = sqlite3.connect(
+                f"{Path(self.db_path).absolute().as_uri()}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+                cached_statements=_STATEMENT_CACHE_SIZE,
+            )
+            conn.executescript(_CONNECTION_PRAGMAS)
+            conn.execute("PRAGMA query_only = ON")
+            self._local.readonly_conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
         return conn
 
+    def _configure_connection(self, conn: sqlite3.Connection) -> None:
+        """
+        新しく作成した接続を設定
+
+        Args:
+            conn: データベース接続
+        """
+        if self.db_path != ":memory:":
+            # 削除・更新で空いたページを vacuum() で少しずつ解放できるようにする
+            # （テーブル作成前の新しいデータベースでのみ有効なため、WAL への変更より先に指定する）
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            # 書き込みをWALファイルへの追記にし、書き込み中も読み込みを並行できるようにする
+            # （WAL はデータベースファイルに記録されるが、念のため接続ごとに指定する）
+            conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_CONNECTION_PRAGMAS)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Cursor]:
+        """
+        複数の書き込みを1つのトランザクション（1回のコミット）にまとめる
+
+        Yields:
+            sqlite3.Cursor: トランザクション内で使用するカーソル
+        """
+        conn = self.get_connection()
+        # 書き込みはプロセス内で直列化し、SQLite のロック待ち（busy_timeout）や
+        # 読み込みロックから書き込みロックへの昇格失敗を避ける
+        with self._write_lock:
+            # 同じスレッドで前の書き込みが失敗し、暗黙のトランザクションが残っている場合は破棄する
+            if conn.in_transaction:
+                conn.rollback()
+            # 開始時点で書き込みロックを取得する
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn.cursor()
+            except Exception:
+                conn.rollback()
+                raise
+            else:
+                conn.commit()
+
+    def insert_many(self, table: str, columns: str, rows: Iterable[tuple]) -> range:
+        """
+        複数の行を1つのトランザクション（1回のコミット）でまとめて挿入
+
+        複数行を書き込む場合はこのメソッドを使用する（行ごとの execute とコミットを避けるため）。
+
+        Args:
+            table: 挿入先のテーブル名
+            columns: 挿入する列名（カンマ区切り、rows の各要素の並びと一致させる）
+            rows: 挿入する行
+
+        Returns:
+            range: 挿入された行のID（挿入順）
+        """
+        placeholders = ", ".join("?" * (columns.count(",") + 1))
+        with self.transaction() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {table} ({columns}) VALUES ({placeholders})", rows
+            )
+            if cursor.rowcount <= 0:
+                return range(0)
+            return last_insert_ids(cursor, cursor.rowcount)
+
+    @staticmethod
+    def _optimize(conn: sqlite3.Connection) -> None:
+        """
+        統計が古くなったテーブルのみ ANALYZE し、クエリプランナーがインデックスを選べるようにする
+
+        Args:
+            conn: データベース接続
+        """
+        try:
+            # 読み込み専用の接続では ANALYZE の結果を書き込めないため実行しない
+            if conn.execute("PRAGMA query_only").fetchone()[0]:
+                return
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            logging.warning(f"PRAGMA optimize に失敗しました: {e}")
+
+    def vacuum(self, pages: int = 1000) -> None:
+        """
+        空きページを最大 pages ページ解放し、データベースファイルを縮小
+
+        auto_vacuum = INCREMENTAL で作成されたデータベースでのみ効果がある。
+
+        Args:
+            pages: 解放する最大ページ数
+        """
+        self._incremental_vacuum(self.get_connection(), pages)
+
+    def _incremental_vacuum(self, conn: sqlite3.Connection, pages: int) -> None:
+        """
+        指定した接続で PRAGMA incremental_vacuum を実行
+
+        Args:
+            conn: データベース接続（書き込み可能なもの）
+            pages: 解放する最大ページ数
+        """
+        # execute では1ページしか解放されないため、executescript で最後まで実行する
+        with self._write_lock:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.executescript(f"PRAGMA incremental_vacuum({int(pages)});")
+
+    def _checkpoint(self, conn: sqlite3.Connection) -> None:
+        """
+        WALファイルの内容をデータベースファイルに書き戻し、WALファイルを空にする
+
+        Args:
+            conn: データベース接続（書き込み可能なもの）
+        """
+        if self.db_path == ":memory:":
+            return
+        try:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        except sqlite3.Error as e:
+            logging.warning(f"WALのチェックポイントに失敗しました: {e}")
+
+    def _schedule_optimize(self) -> None:
+        """OPTIMIZE_INTERVAL 秒後に PRAGMA optimize を実行するタイマーを開始"""
+        self._optimize_timer = threading.Timer(
+            self.OPTIMIZE_INTERVAL, self._run_periodic_optimize
+        )
+        # タイマーがプロセスの終了を妨げないようにする
+        self._optimize_timer.daemon = True
+        self._optimize_timer.start()
+
+    def _run_periodic_optimize(self) -> None:
+        """定期的な PRAGMA optimize・空きページの解放・WALのチェックポイントを実行し、次の実行を予約"""
+        if self._closed:
+            return
+        # タイマーは実行ごとに別のスレッドになるため、最初に作成した接続を使い回す
+        if self._optimize_conn is None:
+            self._optimize_conn = self.get_connection()
+        self._optimize(self._optimize_conn)
+        try:
+            self._incremental_vacuum(self._optimize_conn, self.VACUUM_PAGES)
+        except sqlite3.Error as e:
+            logging.warning(f"空きページの解放に失敗しました: {e}")
+        # 読み込みのたびに参照するWALファイルが大きくなり続けないようにする
+        self._checkpoint(self._optimize_conn)
+        # close_all でタイマーが止められていなければ次の実行を予約する
+        if self._optimize_timer is not None:
+            self._schedule_optimize()
+
     def close_connection(self) -> None:
         """データベース接続を閉じる"""
-        # 接続はget_connectionで毎回新規作成するため、
-        # このメソッドは必要ないが互換性のために残しておく
-        pass
+        # 呼び出したスレッドの接続のみ閉じる（次に get_connection した時に作り直す）
+        for name in ("conn", "readonly_conn"):
+            conn = getattr(self._local, name, None)
+            if conn is None:
+                continue
+            with self._connections_lock:
+                if conn in self._connections:
+                    self._connections.remove(conn)
+            self._optimize(conn)
+            if name == "conn":
+                self._checkpoint(conn)
+            conn.close()
+            setattr(self._local, name, None)
+
+    def close_all(self) -> None:
+        """
+        全スレッドのデータベース接続を閉じる（プロセス終了時に呼ばれる）
+
+        以降はどのスレッドからも接続を取得できなくなる。
+        """
+        if self._closed:
+            return
+        self._closed = True
+        # 閉じた後はプロセス終了まで atexit がこのインスタンスを保持し続けないようにする
+        atexit.unregister(self.close_all)
+        if self._optimize_timer is not None:
+            self._optimize_timer.cancel()
+            self._optimize_timer = None
+        # 実行中・実行待ちのデータベース操作が終わってから接続を閉じる
+        self._executor.shutdown(wait=True)
+        self._optimize_conn = None
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        # 最後の接続を閉じる時に SQLite がチェックポイントを行い、WALファイルを削除する
+        for conn in connections:
+            self._optimize(conn)
+            conn.close()
+        self._local.conn = None
+        self._local.readonly_conn = None
 
     def initialize_database(self) -> None:
         """データベースのテーブルを初期化"""
+        # インメモリデータベースは接続ごとに別のデータベースになるため毎回初期化する
+        if self.db_path == ":memory:":
+            self._initialize_schema()
+            return
+
+        # 複数のスレッドで同時に作成された場合も、初期化（コミット）が終わるまで他を待たせる
+        # （初期化済みかどうかは _initialize_schema がファイルの内容から判定するため、
+        #   ファイルが削除・再作成された場合もスキーマを作り直す）
+        with DatabaseManager._init_lock:
+            self._initialize_schema()
+
+    def _initialize_schema(self) -> None:
+        """スキーマを作成し、必要なマイグレーションを適用"""
         conn = self.get_connection()
         cursor = conn.cursor()
 
-        # トピックテーブル
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS topics (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            description TEXT,
-            created_at TEXT NOT NULL,
-            updated_at TEXT NOT NULL
-        )
-        """)
+        # 接続作成時に WAL に変更しているため、変更できたかを確認する
+        # （インメモリデータベースでは WAL を使えないため確認しない）
+        if self.db_path != ":memory:":
+            journal_mode = cursor.execute("PRAGMA journal_mode").fetchone()[0]
+            if journal_mode.lower() != "wal":
+                logging.warning(
+                    f"WALモードに変更できませんでした（journal_mode={journal_mode}）"
+                )
 
-        # ニュースデータテーブル
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS news_data (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            topic_id INTEGER NOT NULL,
-            sources TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            FOREIGN KEY (topic_id) REFERENCES topics (id)
-        )
-        """)
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        table_count = cursor.execute(
+            "SELECT count(*) FROM sqlite_master WHERE type = 'table'"
+            f" AND name IN ({', '.join('?' for _ in _TABLE_DDL)})",
+            tuple(_TABLE_DDL),
+        ).fetchone()[0]
 
-        # 記事テーブル
-        cursor.execute("""
-        CREATE TABLE IF NOT EXISTS articles (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            topic_id INTEGER NOT NULL,
-            news_data_id INTEGER,
-            title TEXT NOT NULL,
-            content TEXT NOT NULL,
-            improved_content TEXT,
-            status TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            updated_at TEXT NOT NULL,
-            published_at TEXT,
-            FOREIGN KEY (topic_id) REFERENCES topics (id),
-            FOREIGN KEY (news_data_id) REFERENCES news_data (id)
-        )
-        """)
+        # 初期化済みのデータベースでは書き込みトランザクションを発行しない
+        if table_count == len(_TABLE_DDL) and version == SCHEMA_VERSION:
+            logging.info("データベースは初期化済みです")
+            return
+
+        # 既存のデータベースは必要なマイグレーションを順に適用
+        if table_count and version < 1:
+            self._migrate_timestamps_to_epoch(conn)
+        elif table_count and version < 5:
+            logging.info("テーブルを現在の定義（STRICT・検査制約）に移行します")
+            self._rebuild_tables(conn)
 
-        conn.commit()
+        try:
+            conn.executescript(_SCHEMA_SCRIPT)
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+
+        # 全文検索インデックスを追加する前からある記事を索引する
+        if table_count and version < 4:
+            with self.transaction() as cursor:
+                cursor.execute(
+                    "INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')"
+                )
         logging.info("データベースの初期化が完了しました")
+
+    def _migrate_timestamps_to_epoch(self, conn: sqlite3.Connection) -> None:
+        """
+        ISO文字列で保存されていた日時をUNIXエポック秒（INTEGER）に変換する
+
+        Args:
+            conn: データベース接続
+        """
+        logging.info("日時カラムをUNIXエポック秒に移行します")
+
+        def to_epoch(column: str, value: Any) -> Any:
+            if column in _TIMESTAMP_COLUMNS and value:
+                return int(datetime.fromisoformat(value).timestamp())
+            return value
+
+        self._rebuild_tables(conn, to_epoch)
+
+    def _rebuild_tables(
+        self,
+        conn: sqlite3.Connection,
+        convert: Optional[Callable[[str, Any], Any]] = None,
+    ) -> None:
+        """
+        全テーブルを現在の定義で作り直し、データを移す
+
+        Args:
+            conn: データベース接続
+            convert: 移す値を変換する関数（列名と値を受け取る、None の場合はそのまま移す）
+        """
+        # テーブルを作り直す間は外部キーの検査を止める（トランザクション外でのみ変更できる）
+        conn.execute("PRAGMA foreign_keys = OFF")
+        conn.execute("BEGIN")
+        try:
+            for table, ddl in _TABLE_DDL.items():
+                columns = [
+                    row[1] for row in conn.execute(f"PRAGMA table_info({table})")
+                ]
+                rows = conn.execute(f"SELECT {', '.join(columns)} FROM {table}")
+                if convert is not None:
+                    rows = [
+                        tuple(
+                            convert(column, value)
+                            for column, value in zip(columns, row)
+                        )
+                        for row in rows
+                    ]
+                else:
+                    rows = rows.fetchall()
+
+                # 新しい定義のテーブルを作成してデータを移し、元のテーブルと置き換える
+                conn.execute(ddl.replace(f" {table} (", f" {table}_new (", 1))
+                conn.executemany(
+                    f"INSERT INTO {table}_new ({', '.join(columns)}) "
+                    f"VALUES ({', '.join('?' for _ in columns)})",
+                    rows,
+                )
+                conn.execute(f"DROP TABLE {table}")
+                conn.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+        except Exception:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+        finally:
+            conn.execute("PRAGMA foreign_keys = ON")
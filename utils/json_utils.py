@@ -0,0 +1,68 @@
+# utils/json_utils.py
+import dataclasses
+import json
+from datetime import datetime
+from typing import Any
+
+try:
+    import orjson as _orjson
+except ImportError:  # orjson が無い環境では標準の json を使用
+    _orjson = None
+
+
+def loads(data: Any) -> Any:
+    """
+    JSON文字列（またはバイト列）を解析
+
+    Args:
+        data: JSON文字列またはバイト列
+
+    Returns:
+        Any: 解析結果
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def _default(obj: Any) -> Any:
+    """
+    標準の json で扱えないオブジェクトを変換する default 関数
+
+    モデル（dataclass）は辞書に、datetime はISO形式の文字列に変換する。
+    orjson はどちらもそのまま扱えるため、標準の json を使用する場合のみ使われる。
+
+    Args:
+        obj: 変換するオブジェクト
+
+    Returns:
+        Any: JSONに変換可能なオブジェクト
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    オブジェクトをUTF-8のJSONバイト列に変換
+
+    モデル（dataclass）や datetime を含むオブジェクトもそのまま変換できる。
+
+    Args:
+        obj: 変換するオブジェクト
+        indent: 2スペースでインデントするかどうか
+
+    Returns:
+        bytes: JSONバイト列
+    """
+    if _orjson is not None:
+        option = _orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= _orjson.OPT_INDENT_2
+        return _orjson.dumps(obj, option=option)
+    return json.dumps(
+        obj, ensure_ascii=False, indent=2 if indent else None, default=_default
+    ).encode("utf-8")
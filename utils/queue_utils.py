@@ -0,0 +1,94 @@
+# utils/queue_utils.py
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional
+
+
+class WorkerStage:
+    """有界キューと一定数のワーカーで非同期処理を実行するパイプラインの段"""
+
+    def __init__(self, workers: int = 4, maxsize: int = 8):
+        """
+        段の初期化
+
+        Args:
+            workers: 同時に処理を実行するワーカー数
+            maxsize: 処理待ちのキューの最大長（超えた場合は投入側が待つ）
+        """
+        self.workers = workers
+        self.maxsize = maxsize
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._tasks: List[asyncio.Task] = []
+
+    async def run(self, fn: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """
+        処理をキューに入れ、ワーカーが実行した結果を待つ
+
+        キューとワーカーはそれを作成したイベントループでしか使えないため、
+        別のイベントループから呼ばれた場合は新しく作成する。
+
+        Args:
+            fn: 実行する非同期関数
+            *args: fn に渡す引数
+
+        Returns:
+            Any: fn の戻り値（fn が送出した例外はそのまま送出する）
+
+        この呼び出しがキャンセルされた場合は、待機中または実行中の処理もキャンセルする。
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+            self._tasks = [
+                loop.create_task(self._worker(self._queue)) for _ in range(self.workers)
+            ]
+
+        future = loop.create_future()
+        await self._queue.put((future, fn, args))
+        try:
+            return await future
+        except asyncio.CancelledError:
+            # ワーカー側で処理を取り消せるよう Future をキャンセル済みにする
+            future.cancel()
+            raise
+
+    @staticmethod
+    async def _worker(queue: asyncio.Queue) -> None:
+        """
+        キューから処理を取り出して実行し、結果を投入側の Future に設定
+
+        Args:
+            queue: 処理待ちのキュー
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            future, fn, args = await queue.get()
+            try:
+                # 待機中に投入側がキャンセルされた処理は実行しない
+                if future.done():
+                    continue
+
+                # 投入側がキャンセルされたら実行中の処理もキャンセルする
+                job = loop.create_task(fn(*args))
+                future.add_done_callback(lambda _, job=job: job.cancel())
+                try:
+                    # asyncio.wait は処理の例外を送出しないため、
+                    # ここで CancelledError が送出されるのはワーカー自身のキャンセル時のみ
+                    await asyncio.wait((job,))
+                except asyncio.CancelledError:
+                    job.cancel()
+                    raise
+
+                # CancelledError などの BaseException も投入側に伝え、ワーカーは処理を続ける
+                error = None if job.cancelled() else job.exception()
+                if future.done():
+                    continue
+                if job.cancelled():
+                    future.cancel()
+                elif error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(job.result())
+            finally:
+                queue.task_done()